@@ -35,8 +35,9 @@ PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
 ]
 
-# Keep migrations enabled in CI/CD (needed for proper database setup)
-# Disable locally for faster tests by setting DISABLE_MIGRATIONS=1
+# Keep migrations enabled in CI/CD (needed for proper database setup: the raw-SQL
+# profile helpers write legacy portfolio_profile columns that only migrations create)
+# Disable locally for faster tests by setting DISABLE_MIGRATIONS=1 (non-profile suites only)
 import os
 if os.environ.get('DISABLE_MIGRATIONS'):
     class DisableMigrations:
@@ -72,6 +73,16 @@ LOGGING = {
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles_test')  # noqa
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media_test')  # noqa
 
+# Keep uploaded files in memory so image tests never touch the disk
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.InMemoryStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
 # Disable auto-translation in tests
 AUTO_TRANSLATION_ENABLED = False
 
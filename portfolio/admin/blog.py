@@ -4,6 +4,7 @@ from django.utils.html import format_html
 from django.utils import translation
 from parler.admin import TranslatableAdmin
 from ..models import BlogPost, Category
+from ..sitemaps import invalidate_static_lastmod
 
 @admin.register(Category)
 class CategoryAdmin(TranslatableAdmin):
@@ -96,12 +97,16 @@ class BlogPostAdmin(TranslatableAdmin):
     def mark_as_published(self, request, queryset):
         """Acción para marcar posts como publicados"""
         updated = queryset.update(status='published')
+        # update() no dispara post_save: refrescar el lastmod del sitemap
+        invalidate_static_lastmod()
         self.message_user(request, f'{updated} posts marcados como publicados.')
     mark_as_published.short_description = "Marcar como publicado"
     
     def mark_as_draft(self, request, queryset):
         """Acción para marcar posts como borrador"""
         updated = queryset.update(status='draft')
+        # update() no dispara post_save: refrescar el lastmod del sitemap
+        invalidate_static_lastmod()
         self.message_user(request, f'{updated} posts marcados como borrador.')
     mark_as_draft.short_description = "Marcar como borrador"
     
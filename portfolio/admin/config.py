@@ -105,7 +105,7 @@ class AutoTranslationRecordAdmin(admin.ModelAdmin):
     readonly_fields = (
         'content_type', 'object_id', 'language_code', 'source_language',
         'provider', 'duration_ms', 'auto_generated', 'status',
-        'error_message', 'created_at', 'updated_at',
+        'error_message', 'source_hash', 'created_at', 'updated_at',
     )
     ordering = ('-updated_at',)
 
@@ -0,0 +1,76 @@
+"""
+Management command to pre-render the sitemap to a static XML file.
+Run it from cron so crawlers are served the file by nginx and never reach
+the sitemap queries; the Django view remains the fallback on a miss.
+"""
+
+import io
+import os
+
+from django.conf import settings
+from django.contrib.sitemaps.views import sitemap
+from django.core.exceptions import DisallowedHost
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import translation
+from portfolio.sitemaps import sitemaps
+
+
+class Command(BaseCommand):
+    help = 'Render sitemap.xml into MEDIA_ROOT/sitemaps/'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--domain',
+            type=str,
+            default=None,
+            help='Domain used in sitemap URLs (default: first ALLOWED_HOSTS entry)'
+        )
+        parser.add_argument(
+            '--insecure',
+            action='store_true',
+            help='Generate http:// URLs instead of https://'
+        )
+
+    def handle(self, *args, **options):
+        domain = options['domain'] or self.get_default_domain()
+        output_dir = os.path.join(settings.MEDIA_ROOT, 'sitemaps')
+        os.makedirs(output_dir, exist_ok=True)
+
+        request = self.build_request(domain, secure=not options['insecure'])
+        try:
+            # The sitemap view builds absolute URLs from get_host(), which
+            # validates the host against ALLOWED_HOSTS.
+            request.get_host()
+        except DisallowedHost:
+            raise CommandError(f'Domain "{domain}" is not in ALLOWED_HOSTS')
+
+        with translation.override(settings.LANGUAGE_CODE):
+            response = sitemap(request, sitemaps)
+            response.render()
+
+        output_path = os.path.join(output_dir, 'sitemap.xml')
+        with open(output_path, 'wb') as fh:
+            fh.write(response.content)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Sitemap written to {output_path} ({len(response.content)} bytes) for {domain}')
+        )
+
+    def build_request(self, domain, secure=True):
+        """Build a GET request for /sitemap.xml as served on ``domain``"""
+        return WSGIRequest({
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': '/sitemap.xml',
+            'SERVER_NAME': domain,
+            'SERVER_PORT': '443' if secure else '80',
+            'HTTP_HOST': domain,
+            'wsgi.url_scheme': 'https' if secure else 'http',
+            'wsgi.input': io.BytesIO(),
+        })
+
+    def get_default_domain(self):
+        for host in settings.ALLOWED_HOSTS:
+            if host and host != '*' and not host.startswith('.'):
+                return host
+        return 'localhost'
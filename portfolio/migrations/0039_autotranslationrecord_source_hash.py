@@ -0,0 +1,18 @@
+# Generated by Django 5.2.12 on 2026-10-17 07:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0038_alter_siteconfiguration_translation_timeout'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='autotranslationrecord',
+            name='source_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.12 on 2026-10-17 07:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0039_autotranslationrecord_source_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pagevisit',
+            index=models.Index(fields=['-timestamp'], name='pv_ts_desc_idx'),
+        ),
+    ]
@@ -67,6 +67,11 @@ class SiteConfiguration(models.Model):
     def __str__(self):
         return "Site configuration"
 
+    def clean(self):
+        super().clean()
+        if not self.pk and SiteConfiguration.objects.exists():
+            raise ValidationError('Only one site configuration instance is allowed.')
+
     def save(self, *args, **kwargs):
         if not self.pk and SiteConfiguration.objects.exists():
             raise ValidationError('Only one site configuration instance is allowed.')
@@ -90,13 +95,13 @@ class SiteConfiguration(models.Model):
         return obj
 
     def get_translation_service(self):
-        """Build TranslationService if auto translation is enabled and configured."""
+        """Return the shared TranslationService if auto translation is enabled and configured."""
         if not self.auto_translate_enabled:
             return None
         if not self.translation_api_url:
             raise ImproperlyConfigured("Translation API URL is required for auto translation.")
-        from .services.translation_service import TranslationService  # lazy import
-        return TranslationService(
+        from .services.translation_service import get_translation_service  # lazy import
+        return get_translation_service(
             provider=self.translation_provider,
             api_url=self.translation_api_url,
             api_key=self.translation_api_key or "",
@@ -130,6 +135,7 @@ class AutoTranslationRecord(models.Model):
     auto_generated = models.BooleanField(default=False)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
     error_message = models.TextField(blank=True)
+    source_hash = models.CharField(max_length=64, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -148,7 +154,7 @@ class AutoTranslationRecord(models.Model):
         self.save(update_fields=['provider', 'duration_ms', 'auto_generated', 'status', 'error_message', 'updated_at'])
 
     def mark_failure(self, message: str):
-        self.auto_generated = False
+        self.auto_generated = True
         self.status = self.STATUS_FAILED
         self.error_message = message[:1000]
         self.save(update_fields=['auto_generated', 'status', 'error_message', 'updated_at'])
@@ -200,6 +206,11 @@ class Profile(TranslatableModel):
     def __str__(self):
         return self.safe_translation_getter("name", any_language=True) or "Perfil"
 
+    def clean(self):
+        super().clean()
+        if not self.pk and Profile.objects.exists():
+            raise ValidationError("Solo puede existir un perfil. Por favor edita el perfil existente.")
+
     def save(self, *args, **kwargs):
         if not self.pk and Profile.objects.exists():
             raise ValidationError("Solo puede existir un perfil. Por favor edita el perfil existente.")
@@ -1187,6 +1198,10 @@ class PageVisit(models.Model):
         verbose_name = "Visita de Página"
         verbose_name_plural = "Visitas de Páginas"
         ordering = ['-timestamp']
+        indexes = [
+            # Analytics ranges, cleanup cutoffs and the default ordering all hit timestamp
+            models.Index(fields=['-timestamp'], name='pv_ts_desc_idx'),
+        ]
 
     def __str__(self):
         return f"{self.page_url} - {self.timestamp.strftime('%Y-%m-%d %H:%M')}"
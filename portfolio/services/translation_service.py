@@ -4,7 +4,8 @@ Translation service abstraction with LibreTranslate support.
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
 import requests
 from django.core.exceptions import ImproperlyConfigured
@@ -31,6 +32,10 @@ class BaseTranslationClient:
     def translate(self, text: str, source: str, target: str, **kwargs) -> str:
         raise NotImplementedError
 
+    def translate_batch(self, texts: List[str], source: str, target: str, **kwargs) -> List[str]:
+        """Translate several texts; clients override this to use a single request."""
+        return [self.translate(text, source, target, **kwargs) for text in texts]
+
 
 class LibreTranslateClient(BaseTranslationClient):
     """Simple HTTP client for LibreTranslate."""
@@ -41,6 +46,8 @@ class LibreTranslateClient(BaseTranslationClient):
         self.api_url = api_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        # Keeps the connection to the provider alive between requests
+        self.session = requests.Session()
 
     def translate(self, text: str, source: str, target: str, **kwargs) -> str:
         if not text:
@@ -52,14 +59,46 @@ class LibreTranslateClient(BaseTranslationClient):
             "target": target,
             "format": kwargs.get("format", "text"),
         }
+        data = self._post(payload)
+        translated_text = data.get("translatedText")
+        if translated_text is None:
+            raise TranslationError("LibreTranslate response missing translatedText")
+
+        return translated_text
+
+    def translate_batch(self, texts: List[str], source: str, target: str, **kwargs) -> List[str]:
+        # Empty strings are not sent to the provider, same as translate()
+        pending = [index for index, text in enumerate(texts) if text]
+        results = [""] * len(texts)
+        if not pending:
+            return results
+
+        # LibreTranslate accepts a list for "q" when the body is JSON
+        payload = {
+            "q": [texts[index] for index in pending],
+            "source": source,
+            "target": target,
+            "format": kwargs.get("format", "text"),
+        }
+        data = self._post(payload, use_json=True)
+        translated_texts = data.get("translatedText")
+        if not isinstance(translated_texts, list) or len(translated_texts) != len(pending):
+            raise TranslationError("LibreTranslate batch response does not match the request")
+
+        for index, translated_text in zip(pending, translated_texts):
+            results[index] = translated_text
+        return results
+
+    def _post(self, payload: dict, use_json: bool = False) -> dict:
         if self.api_key:
             payload["api_key"] = self.api_key
+        body = {"json": payload} if use_json else {"data": payload}
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/translate",
-                data=payload,
                 timeout=self.timeout,
+                **body,
             )
         except requests.RequestException as exc:
             logger.error("LibreTranslate request failed: %s", exc)
@@ -68,17 +107,15 @@ class LibreTranslateClient(BaseTranslationClient):
             logger.error("LibreTranslate error: %s", response.text)
             raise TranslationError(f"LibreTranslate responded with {response.status_code}")
 
-        data = response.json()
-        translated_text = data.get("translatedText")
-        if translated_text is None:
-            raise TranslationError("LibreTranslate response missing translatedText")
-
-        return translated_text
+        return response.json()
 
 
 class TranslationService:
     """Facade to translate content according to site configuration."""
 
+    # Upper bound for the in-memory text cache of a long-lived service
+    MAX_CACHED_TEXTS = 1000
+
     def __init__(self, provider: str, api_url: str, api_key: str = "", timeout: int = 30):
         self.provider = provider
         self.api_url = api_url
@@ -96,23 +133,14 @@ class TranslationService:
         return "|".join((provider, source, target, text))
 
     def translate(self, text: str, source: str, target: str, **kwargs) -> TranslationResult:
-        cache_key = self._cache_key(text, source, target, self.provider)
-        cached_text = self._cache.get(cache_key)
-        if cached_text is not None:
-            return TranslationResult(
-                translated_text=cached_text,
-                provider=self.provider,
-                duration_ms=0,
-                cached=True,
-            )
+        cached = self._get_cached(text, source, target)
+        if cached is not None:
+            return cached
 
         start = time.monotonic()
         translated_text = self.client.translate(text, source, target, **kwargs)
         duration_ms = int((time.monotonic() - start) * 1000)
 
-        # store in simple cache attached to the method
-        self._cache[cache_key] = translated_text
-
         logger.debug(
             "Translated %s chars %s->%s in %sms via %s",
             len(text),
@@ -122,8 +150,60 @@ class TranslationService:
             self.provider,
         )
 
+        return self._store(text, source, target, translated_text, duration_ms)
+
+    def translate_batch(self, texts: List[str], source: str, target: str, **kwargs) -> List[TranslationResult]:
+        """Translate several texts with one provider request (cached texts are skipped)."""
+        results = [self._get_cached(text, source, target) for text in texts]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        start = time.monotonic()
+        translated_texts = self.client.translate_batch([texts[i] for i in pending], source, target, **kwargs)
+        duration_ms = int((time.monotonic() - start) * 1000)
+
+        logger.debug(
+            "Translated %s texts %s->%s in %sms via %s",
+            len(pending),
+            source,
+            target,
+            duration_ms,
+            self.provider,
+        )
+
+        # Every text of the batch shares the duration of the single request
+        for index, translated_text in zip(pending, translated_texts):
+            results[index] = self._store(texts[index], source, target, translated_text, duration_ms)
+        return results
+
+    def _get_cached(self, text: str, source: str, target: str) -> Optional[TranslationResult]:
+        cached_text = self._cache.get(self._cache_key(text, source, target, self.provider))
+        if cached_text is None:
+            return None
+        return TranslationResult(
+            translated_text=cached_text,
+            provider=self.provider,
+            duration_ms=0,
+            cached=True,
+        )
+
+    def _store(self, text: str, source: str, target: str, translated_text: str, duration_ms: int) -> TranslationResult:
+        # store in simple cache attached to the service
+        if len(self._cache) >= self.MAX_CACHED_TEXTS:
+            self._cache.clear()
+        self._cache[self._cache_key(text, source, target, self.provider)] = translated_text
         return TranslationResult(
             translated_text=translated_text,
             provider=self.provider,
             duration_ms=duration_ms,
         )
+
+
+@lru_cache(maxsize=1)
+def get_translation_service(provider: str, api_url: str, api_key: str = "", timeout: int = 30) -> TranslationService:
+    """
+    Return the service for the given settings, reusing the previous one while they
+    don't change so its HTTP session and text cache survive across translation runs.
+    """
+    return TranslationService(provider=provider, api_url=api_url, api_key=api_key, timeout=timeout)
@@ -1,10 +1,11 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from parler.signals import post_translation_save
 
 from .models import Profile, Project, BlogPost, Experience, Education
+from .sitemaps import invalidate_static_lastmod
 from .translation import schedule_auto_translation
 
 logger = logging.getLogger(__name__)
@@ -15,16 +16,17 @@ def _handle_auto_translation(instance, **kwargs):
     created = kwargs.get('created', False)
 
     logger.info(
-        f"post_save signal: {instance.__class__.__name__} pk={instance.pk}, "
-        f"created={created}, raw={raw}"
+        "post_save signal: %s pk=%s, "
+        "created=%s, raw=%s",
+        instance.__class__.__name__, instance.pk, created, raw,
     )
 
     if raw:
-        logger.debug(f"Skipping translation for {instance.__class__.__name__} pk={instance.pk} (raw=True)")
+        logger.debug("Skipping translation for %s pk=%s (raw=True)", instance.__class__.__name__, instance.pk)
         return
 
     if instance.pk is None:
-        logger.warning(f"Instance {instance.__class__.__name__} has pk=None, skipping translation")
+        logger.warning("Instance %s has pk=None, skipping translation", instance.__class__.__name__)
         return
 
     schedule_auto_translation(instance)
@@ -42,7 +44,7 @@ def _handle_translation_saved(sender, instance, **kwargs):
     master = instance.master if hasattr(instance, 'master') else None
 
     if master is None:
-        logger.warning(f"post_translation_save: no master instance found")
+        logger.warning("post_translation_save: no master instance found")
         return
 
     # Get the default language from settings
@@ -53,20 +55,22 @@ def _handle_translation_saved(sender, instance, **kwargs):
     default_language = config.default_language or settings.LANGUAGE_CODE
 
     logger.info(
-        f"post_translation_save signal: {master.__class__.__name__} pk={master.pk}, "
-        f"language={language_code}, default={default_language}"
+        "post_translation_save signal: %s pk=%s, "
+        "language=%s, default=%s",
+        master.__class__.__name__, master.pk, language_code, default_language,
     )
 
     # CRITICAL: Only schedule translation if we're saving the DEFAULT language
     # This prevents infinite loops where saving ES translation triggers another translation
     if language_code != default_language:
         logger.debug(
-            f"Skipping auto-translation: saved language '{language_code}' is not default '{default_language}'"
+            "Skipping auto-translation: saved language '%s' is not default '%s'",
+            language_code, default_language,
         )
         return
 
-    # Schedule translation after the transaction commits
-    schedule_auto_translation(master)
+    # Schedule translation after the transaction commits (reusing the config loaded above)
+    schedule_auto_translation(master, config=config)
 
 
 # Use post_translation_save for all parler models (fires after translation is saved)
@@ -88,3 +92,10 @@ def auto_translate_on_translation_save(sender, instance, **kwargs):
         return
 
     _handle_translation_saved(sender, instance, **kwargs)
+
+
+@receiver([post_save, post_delete], sender=Project)
+@receiver([post_save, post_delete], sender=BlogPost)
+def invalidate_sitemap_lastmod(sender, **kwargs):
+    """Content changed, so the static pages' sitemap lastmod is stale."""
+    invalidate_static_lastmod()
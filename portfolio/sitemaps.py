@@ -2,11 +2,48 @@
 Sitemaps for portfolio application.
 """
 
+from django.conf import settings
 from django.contrib.sitemaps import Sitemap
+from django.core.cache import cache
+from django.db.models import Max
 from django.urls import reverse
-from django.utils import timezone, translation
+from django.utils import translation
 from .models import Project, BlogPost, Category
 
+# Crawlers hit sitemap.xml often while content rarely changes; the view is
+# cached for this long (see config/urls.py and the warm_sitemap command).
+SITEMAP_CACHE_TIMEOUT = 60 * 60 * 6
+
+STATIC_LASTMOD_CACHE_KEY = 'sitemap:static_lastmod'
+
+
+def get_static_lastmod():
+    """
+    Latest content change across public projects and published posts.
+
+    Static pages list that content, so this is their real modification date;
+    a stable value lets crawlers use conditional requests. Cached until a
+    project or post is saved or deleted (see signals.py) and, as a safety net
+    for bulk updates that bypass signals, for SITEMAP_CACHE_TIMEOUT at most.
+    """
+    lastmod = cache.get(STATIC_LASTMOD_CACHE_KEY)
+    if lastmod is None:
+        dates = [
+            Project.objects.filter(visibility='public').aggregate(latest=Max('updated_at'))['latest'],
+            BlogPost.objects.filter(status='published').aggregate(latest=Max('updated_at'))['latest'],
+        ]
+        dates = [date for date in dates if date is not None]
+        if not dates:
+            return None
+        lastmod = max(dates)
+        cache.set(STATIC_LASTMOD_CACHE_KEY, lastmod, SITEMAP_CACHE_TIMEOUT)
+    return lastmod
+
+
+def invalidate_static_lastmod():
+    cache.delete(STATIC_LASTMOD_CACHE_KEY)
+
+
 class StaticViewSitemap(Sitemap):
     """Sitemap for static views."""
     priority = 0.8
@@ -19,47 +56,87 @@ class StaticViewSitemap(Sitemap):
         return reverse(item)
     
     def lastmod(self, item):
-        return timezone.now()
+        return get_static_lastmod()
 
 class ProjectSitemap(Sitemap):
     """Sitemap for projects."""
     changefreq = 'monthly'
     priority = 0.7
-    
+
+    def __init__(self):
+        self._items_cache = None
+
     def items(self):
-        return Project.objects.filter(visibility='public').order_by('-updated_at')
+        # The sitemap framework calls items() more than once per request
+        # (paginator + url generation), so evaluate the queryset only once.
+        if self._items_cache is None:
+            # Plain dicts: only the URL inputs and lastmod are needed, so
+            # skip hydrating full (translatable) model instances.
+            self._items_cache = list(
+                Project.objects.filter(visibility='public')
+                .values('slug', 'updated_at')
+                .order_by('-updated_at')
+            )
+        return self._items_cache
     
     def lastmod(self, obj):
-        return obj.updated_at
+        return obj['updated_at']
     
     def location(self, obj):
-        return obj.get_absolute_url()
+        return reverse('portfolio:project-detail', kwargs={'slug': obj['slug']})
 
 class BlogPostSitemap(Sitemap):
     """Sitemap for blog posts."""
     changefreq = 'weekly'
     priority = 0.9
-    
+
+    def __init__(self):
+        self._items_cache = None
+
     def items(self):
-        return BlogPost.objects.filter(status='published').order_by('-updated_at')
+        if self._items_cache is None:
+            self._items_cache = list(
+                BlogPost.objects.filter(status='published')
+                .values('slug', 'updated_at')
+                .order_by('-updated_at')
+            )
+        return self._items_cache
     
     def lastmod(self, obj):
-        return obj.updated_at
+        return obj['updated_at']
     
     def location(self, obj):
-        return obj.get_absolute_url()
+        return reverse('portfolio:post-detail', kwargs={'slug': obj['slug']})
 
 class CategorySitemap(Sitemap):
     """Sitemap for blog categories."""
     changefreq = 'monthly'
     priority = 0.6
-    
+
+    def __init__(self):
+        self._items_cache = {}
+
+    def get_urls(self, page=1, site=None, protocol=None):
+        # One pass per configured language, each with an explicit active
+        # language so items() and location() agree on the URL prefix.
+        urls = []
+        for language_code, _name in settings.LANGUAGES:
+            with translation.override(language_code):
+                urls.extend(super().get_urls(page=page, site=site, protocol=protocol))
+        return urls
+
     def items(self):
-        current_language = translation.get_language()
-        qs = Category.objects.filter(is_active=True)
-        if current_language:
-            qs = qs.filter(translations__language_code=current_language)
-        return qs.order_by('translations__name')
+        return self.get_items_for_language(translation.get_language())
+
+    def get_items_for_language(self, language_code):
+        if language_code not in self._items_cache:
+            qs = Category.objects.filter(is_active=True)
+            if language_code:
+                qs = qs.language(language_code).filter(translations__language_code=language_code)
+            self._items_cache[language_code] = list(
+                qs.only('slug', 'updated_at').distinct().order_by('translations__name')
+            )
+        return self._items_cache[language_code]
     
     def lastmod(self, obj):
         return obj.updated_at
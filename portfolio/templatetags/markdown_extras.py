@@ -1,35 +1,78 @@
 # portfolio/templatetags/markdown_extras.py
 from django import template
+from django.core.cache import cache
 from django.template.defaultfilters import stringfilter
 from django.utils.safestring import mark_safe
+from functools import lru_cache
+import hashlib
 import html
+import threading
 import markdown as md
 
 register = template.Library()
 
 # Extensiones combinadas
 _EXTENSIONS = [
-    "extra",        # tablas, notas al pie, etc.
-    "fenced_code",  # bloques de código con ```
-    "tables",       # soporte explícito de tablas
+    "extra",        # tablas, notas al pie, bloques ``` (incluye fenced_code y tables)
     "toc",          # tabla de contenidos (anclas)
     "nl2br",        # saltos de línea -> <br>
-    "codehilite",   # resaltado de código (envoltura/clases)
+    # "codehilite" se quitó: con use_pygments=False no resaltaba nada y solo
+    # añadía class="highlight" (sin CSS) a los bloques indentados. Los bloques
+    # ``` ya llevan class="language-xxx" (lo usa mermaid en blog_detail.html).
+    # Si se quiere resaltado real, conviene hacerlo en el cliente.
 ]
 
 # Configuración combinada
 _EXTENSION_CONFIGS = {
-    "codehilite": {
-        "css_class": "highlight",
-        "linenums": False,
-        # Mantengo False porque así lo tenías; si quieres colores reales,
-        # cambia a True e incluye CSS de Pygments (noclasses=False).
-        "use_pygments": False,
-    },
     # Opcionalmente, puedes configurar 'toc' (permalink a títulos):
     # "toc": {"permalink": True},
 }
 
+# El HTML generado depende solo del texto de entrada, así que se cachea por
+# hash del contenido: no hace falta invalidar al editar un post.
+# Sube _RENDERER_VERSION al cambiar extensiones/configuración para que el
+# HTML cacheado con la configuración anterior no se siga sirviendo.
+_RENDERER_VERSION = 3
+_CACHE_PREFIX = f"md:v{_RENDERER_VERSION}:"
+_CACHE_TIMEOUT = 60 * 60  # 1 hora
+
+
+# md.markdown() construye un Markdown nuevo (y carga todas las extensiones)
+# en cada llamada; reutilizamos una instancia por hilo y la reiniciamos.
+_local = threading.local()
+
+
+def _get_renderer() -> md.Markdown:
+    renderer = getattr(_local, "renderer", None)
+    if renderer is None:
+        renderer = _local.renderer = md.Markdown(
+            extensions=_EXTENSIONS,
+            extension_configs=_EXTENSION_CONFIGS,
+            output_format="html5",
+        )
+    return renderer
+
+
+def _convert(text: str) -> str:
+    """Renderiza Markdown a HTML."""
+    return _get_renderer().reset().convert(text)
+
+
+@lru_cache(maxsize=512)
+def _render(value: str) -> str:
+    """
+    Devuelve el HTML de `value`: primero la LRU del proceso (gratis) y, si no
+    está, la caché compartida (Redis/BD) antes de volver a parsear.
+    """
+    key = _CACHE_PREFIX + hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+    def render():
+        # Unescape HTML entities that Django may have escaped
+        return _convert(html.unescape(value))
+
+    return cache.get_or_set(key, render, _CACHE_TIMEOUT)
+
+
 @register.filter(name="markdown")
 @stringfilter
 def markdown_filter(value: str) -> str:
@@ -39,13 +82,4 @@ def markdown_filter(value: str) -> str:
     if not value:
         return ""
 
-    # Unescape HTML entities that Django may have escaped
-    unescaped_value = html.unescape(value)
-
-    result = md.markdown(
-        unescaped_value,
-        extensions=_EXTENSIONS,
-        extension_configs=_EXTENSION_CONFIGS,
-        output_format="html5",
-    )
-    return mark_safe(result)
+    return mark_safe(_render(value))
@@ -1,15 +1,18 @@
 from datetime import date
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.contrib.contenttypes.models import ContentType
+from django.test import SimpleTestCase, TestCase
 
 from portfolio.models import SiteConfiguration, Experience, AutoTranslationRecord
-from portfolio.translation import _run_auto_translation
-from portfolio.services.translation_service import TranslationResult, TranslationError
+from portfolio.translation import AUTO_TRANSLATABLE_MODELS, _get_content_type, _run_auto_translation
+from portfolio.services.translation_service import TranslationResult, TranslationError, TranslationService
 
 
+@patch('portfolio.models.SiteConfiguration.get_translation_service')
 class AutoTranslationServiceTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         config = SiteConfiguration.get_solo()
         config.default_language = 'en'
         config.auto_translate_enabled = True
@@ -18,54 +21,243 @@ class AutoTranslationServiceTests(TestCase):
         config.translation_timeout = 5
         config.save()
 
-    def _create_experience(self):
-        experience = Experience()
-        experience.set_current_language('en')
-        experience.company = "ACME Inc."
-        experience.position = "Senior Engineer"
-        experience.description = "Responsible for designing scalable systems."
-        experience.start_date = date(2021, 1, 1)
-        experience.current = True
-        experience.save()
-        return experience
-
-    def test_successful_auto_translation_creates_record(self):
-        experience = self._create_experience()
+        cls.experience = Experience()
+        cls.experience.set_current_language('en')
+        cls.experience.company = "ACME Inc."
+        cls.experience.position = "Senior Engineer"
+        cls.experience.description = "Responsible for designing scalable systems."
+        cls.experience.start_date = date(2021, 1, 1)
+        cls.experience.current = True
+        cls.experience.save()
 
+    def test_successful_auto_translation_creates_record(self, mock_service):
         class DummyService:
             provider = 'libretranslate'
+            calls = 0
 
-            def translate(self, text, source, target, **kwargs):
-                return TranslationResult(
-                    translated_text=f"{text} ({target})",
-                    provider='libretranslate',
-                    duration_ms=25,
-                )
+            def translate_batch(self, texts, source, target, **kwargs):
+                self.calls += 1
+                return [
+                    TranslationResult(
+                        translated_text=f"{text} ({target})",
+                        provider='libretranslate',
+                        duration_ms=25,
+                    )
+                    for text in texts
+                ]
 
-        with patch('portfolio.models.SiteConfiguration.get_translation_service') as mock_service:
-            mock_service.return_value = DummyService()
-            _run_auto_translation(Experience, experience.pk, 'en')
+        service = DummyService()
+        mock_service.return_value = service
+        _run_auto_translation(Experience, self.experience.pk, 'en')
 
-        translated = Experience.objects.language('es').get(pk=experience.pk)
+        translated = Experience.objects.language('es').get(pk=self.experience.pk)
         self.assertIn('(es)', translated.company)
-        record = AutoTranslationRecord.objects.get(object_id=experience.pk, language_code='es')
+        self.assertIn('(es)', translated.description)
+        # All fields of the object go to the provider in a single request
+        self.assertEqual(service.calls, 1)
+        record = AutoTranslationRecord.objects.get(object_id=self.experience.pk, language_code='es')
         self.assertEqual(record.status, AutoTranslationRecord.STATUS_SUCCESS)
         self.assertTrue(record.auto_generated)
 
-    def test_failed_translation_creates_failure_record(self):
-        experience = self._create_experience()
-
+    def test_failed_translation_creates_failure_record(self, mock_service):
         class FailingService:
             provider = 'libretranslate'
 
-            def translate(self, *args, **kwargs):
+            def translate_batch(self, *args, **kwargs):
                 raise TranslationError("Service unavailable")
 
-        with patch('portfolio.models.SiteConfiguration.get_translation_service') as mock_service:
-            mock_service.return_value = FailingService()
-            _run_auto_translation(Experience, experience.pk, 'en')
+        mock_service.return_value = FailingService()
+        _run_auto_translation(Experience, self.experience.pk, 'en')
 
-        record = AutoTranslationRecord.objects.get(object_id=experience.pk, language_code='es')
+        record = AutoTranslationRecord.objects.get(object_id=self.experience.pk, language_code='es')
         self.assertEqual(record.status, AutoTranslationRecord.STATUS_FAILED)
-        self.assertFalse(record.auto_generated)
+        self.assertTrue(record.auto_generated)
         self.assertIn('Service unavailable', record.error_message)
+
+    def test_failed_translation_is_retried_on_next_run(self, mock_service):
+        class FlakyService:
+            provider = 'libretranslate'
+            calls = 0
+
+            def translate_batch(self, texts, source, target, **kwargs):
+                self.calls += 1
+                if self.calls == 1:
+                    raise TranslationError("Service unavailable")
+                return [
+                    TranslationResult(translated_text=f"{text} ({target})", provider='libretranslate', duration_ms=5)
+                    for text in texts
+                ]
+
+        service = FlakyService()
+        mock_service.return_value = service
+        _run_auto_translation(Experience, self.experience.pk, 'en')
+        _run_auto_translation(Experience, self.experience.pk, 'en')
+
+        self.assertEqual(service.calls, 2)
+        self.assertIn('(es)', Experience.objects.language('es').get(pk=self.experience.pk).company)
+        record = AutoTranslationRecord.objects.get(object_id=self.experience.pk, language_code='es')
+        self.assertEqual(record.status, AutoTranslationRecord.STATUS_SUCCESS)
+        self.assertEqual(record.error_message, '')
+
+    def test_repeated_translation_updates_existing_record(self, mock_service):
+        class DummyService:
+            provider = 'libretranslate'
+            duration_ms = 25
+
+            def translate_batch(self, texts, source, target, **kwargs):
+                return [
+                    TranslationResult(translated_text=text, provider='libretranslate', duration_ms=self.duration_ms)
+                    for text in texts
+                ]
+
+        service = DummyService()
+        mock_service.return_value = service
+        _run_auto_translation(Experience, self.experience.pk, 'en')
+        service.duration_ms = 10
+        self.experience.translations.filter(language_code='en').update(position="Staff Engineer")
+        _run_auto_translation(Experience, self.experience.pk, 'en')
+
+        record = AutoTranslationRecord.objects.get(object_id=self.experience.pk, language_code='es')
+        self.assertEqual(record.status, AutoTranslationRecord.STATUS_SUCCESS)
+        self.assertEqual(record.duration_ms, 10)
+        self.assertEqual(Experience.objects.language('es').get(pk=self.experience.pk).position, "Staff Engineer")
+
+    def test_unchanged_source_is_not_translated_again(self, mock_service):
+        class DummyService:
+            provider = 'libretranslate'
+            calls = 0
+
+            def translate_batch(self, texts, source, target, **kwargs):
+                self.calls += 1
+                return [TranslationResult(translated_text=text, provider='libretranslate', duration_ms=0) for text in texts]
+
+        service = DummyService()
+        mock_service.return_value = service
+        _run_auto_translation(Experience, self.experience.pk, 'en')
+        _run_auto_translation(Experience, self.experience.pk, 'en')
+
+        self.assertEqual(service.calls, 1)
+
+    def test_manual_translation_record_is_respected(self, mock_service):
+        class UnusedService:
+            provider = 'libretranslate'
+
+            def translate_batch(self, *args, **kwargs):
+                raise AssertionError("manual translations must not be sent to the provider")
+
+        mock_service.return_value = UnusedService()
+        AutoTranslationRecord.objects.create(
+            content_type=ContentType.objects.get_for_model(Experience),
+            object_id=self.experience.pk,
+            language_code='es',
+            source_language='en',
+            auto_generated=False,
+        )
+
+        _run_auto_translation(Experience, self.experience.pk, 'en')
+
+        self.assertNotIn('es', Experience.objects.get(pk=self.experience.pk).get_available_languages())
+
+    def test_save_loads_site_configuration_once(self, mock_service):
+        class DummyService:
+            provider = 'libretranslate'
+
+            def translate_batch(self, texts, source, target, **kwargs):
+                return [TranslationResult(translated_text=text, provider='libretranslate', duration_ms=0) for text in texts]
+
+        mock_service.return_value = DummyService()
+        self.experience.position = "Staff Engineer"
+
+        with patch.object(SiteConfiguration, 'get_solo', wraps=SiteConfiguration.get_solo) as get_solo:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.experience.save()
+
+        # One lookup for the saved 'en' row (reused by the scheduler and the deferred run)
+        # and one when the generated 'es' row fires the same signal and is skipped
+        self.assertEqual(get_solo.call_count, 2)
+        record = AutoTranslationRecord.objects.get(object_id=self.experience.pk, language_code='es')
+        self.assertEqual(record.status, AutoTranslationRecord.STATUS_SUCCESS)
+
+    def test_saving_untranslated_fields_does_not_schedule_translation(self, mock_service):
+        experience = Experience.objects.get(pk=self.experience.pk)
+        experience.order = 5
+
+        with patch.object(SiteConfiguration, 'get_solo') as get_solo:
+            with self.captureOnCommitCallbacks() as callbacks:
+                experience.save(update_fields=['order'])
+
+        # parler only re-saves modified translations, so no translation signal fires
+        get_solo.assert_not_called()
+        self.assertEqual(callbacks, [])
+
+
+class ContentTypeLookupTests(TestCase):
+    def test_cold_lookup_loads_all_translatable_models_at_once(self):
+        ContentType.objects.clear_cache()
+
+        with self.assertNumQueries(1):
+            _get_content_type(Experience)
+        with self.assertNumQueries(0):
+            for model in AUTO_TRANSLATABLE_MODELS:
+                _get_content_type(model)
+
+
+class TranslationServiceBatchTests(SimpleTestCase):
+    def setUp(self):
+        self.service = TranslationService('libretranslate', 'http://mock-translate.local')
+
+    @patch('portfolio.services.translation_service.requests.Session.post')
+    def test_translate_batch_sends_single_request(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.json.return_value = {'translatedText': ['Hola', 'Mundo']}
+
+        results = self.service.translate_batch(['Hello', 'World'], 'en', 'es')
+
+        self.assertEqual([r.translated_text for r in results], ['Hola', 'Mundo'])
+        mock_post.assert_called_once()
+        self.assertEqual(mock_post.call_args.kwargs['json']['q'], ['Hello', 'World'])
+
+    @patch('portfolio.services.translation_service.requests.Session.post')
+    def test_translate_batch_skips_cached_texts(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.json.return_value = {'translatedText': ['Hola']}
+        self.service.translate_batch(['Hello'], 'en', 'es')
+
+        mock_post.return_value.json.return_value = {'translatedText': ['Mundo']}
+        results = self.service.translate_batch(['Hello', 'World'], 'en', 'es')
+
+        self.assertTrue(results[0].cached)
+        self.assertEqual(results[1].translated_text, 'Mundo')
+        self.assertEqual(mock_post.call_args.kwargs['json']['q'], ['World'])
+
+    @patch('portfolio.services.translation_service.requests.Session.post')
+    def test_translate_batch_does_not_send_empty_texts(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.json.return_value = {'translatedText': ['Hola']}
+
+        results = self.service.translate_batch(['', 'Hello'], 'en', 'es')
+
+        self.assertEqual([r.translated_text for r in results], ['', 'Hola'])
+        self.assertEqual(mock_post.call_args.kwargs['json']['q'], ['Hello'])
+
+    @patch('portfolio.services.translation_service.requests.Session.post')
+    def test_translate_batch_rejects_mismatched_response(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.json.return_value = {'translatedText': 'Hola'}
+
+        with self.assertRaises(TranslationError):
+            self.service.translate_batch(['Hello', 'World'], 'en', 'es')
+
+
+class SiteConfigurationServiceTests(SimpleTestCase):
+    def test_service_is_reused_until_settings_change(self):
+        config = SiteConfiguration(
+            auto_translate_enabled=True,
+            translation_provider='libretranslate',
+            translation_api_url='http://mock-translate.local',
+        )
+        service = config.get_translation_service()
+
+        self.assertIs(config.get_translation_service(), service)
+        config.translation_api_url = 'http://other-translate.local'
+        self.assertIsNot(config.get_translation_service(), service)
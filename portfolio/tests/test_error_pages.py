@@ -1,10 +1,18 @@
-from django.test import TestCase, Client
+"""
+Tests for custom error pages and the first-run setup wizard.
+"""
+from django.core.cache import cache
+from django.test import TestCase, RequestFactory, modify_settings
 from django.urls import reverse
-from django.contrib.auth.models import User
+from django.contrib.auth.models import AnonymousUser
 from django.contrib.auth import get_user_model
-from .models import Profile, SiteConfiguration
+from django.http import Http404
 from django.utils import translation
 from django.db import connection, transaction
+from parler.cache import get_object_cache_keys
+
+from portfolio.models import Profile, SiteConfiguration
+from portfolio.views import custom_403, custom_404, custom_500
 
 
 def create_test_profile(profile_id=1, name="Test User", title="Test Developer", bio="Test bio",
@@ -28,16 +36,30 @@ def create_test_profile(profile_id=1, name="Test User", title="Test Developer",
             [profile_id, language, name, title, bio, location]
         )
 
-        return Profile.objects.get(pk=profile_id)
+        profile = Profile.objects.get(pk=profile_id)
+        # Raw SQL skips parler's save hooks: drop translations cached for an earlier row with this id
+        cache.delete_many(get_object_cache_keys(profile))
+        return profile
 
 
 class ErrorPageTestCase(TestCase):
     """Test cases for custom error pages"""
-    
-    def setUp(self):
-        self.client = Client()
-        # Create a test profile using helper function
-        self.profile = create_test_profile()
+
+    @classmethod
+    def setUpTestData(cls):
+        # Create a test profile using helper function (once per class)
+        cls.profile = create_test_profile()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Bare requests for calling the handlers directly (no middleware run)
+        cls.rf = RequestFactory()
+
+    def _get_request(self):
+        request = self.rf.get('/')
+        request.user = AnonymousUser()
+        return request
     
     def test_404_error_page(self):
         """Test that 404 error page renders correctly"""
@@ -55,28 +77,20 @@ class ErrorPageTestCase(TestCase):
         response = self.client.get('/admin-dashboard/')
         # This should redirect to login, but if we force a 403, it should render our template
         # We'll test the view function directly
-        from .views import custom_403
-        from django.http import Http404
-        
-        request = self.client.request().wsgi_request
+        request = self._get_request()
         response = custom_403(request, Http404())
         self.assertEqual(response.status_code, 403)
     
     def test_500_error_page(self):
         """Test that 500 error page renders correctly"""
         # Test the view function directly
-        from .views import custom_500
-        
-        request = self.client.request().wsgi_request
+        request = self._get_request()
         response = custom_500(request)
         self.assertEqual(response.status_code, 500)
     
     def test_error_pages_with_profile_context(self):
         """Test that error pages include profile context"""
-        from .views import custom_404, custom_500, custom_403
-        from django.http import Http404
-        
-        request = self.client.request().wsgi_request
+        request = self._get_request()
         
         # Test 404
         response = custom_404(request, Http404())
@@ -94,12 +108,11 @@ class ErrorPageTestCase(TestCase):
 class InitialSetupWizardTests(TestCase):
     """Tests for the first-run setup wizard."""
 
-    def setUp(self):
-        self.client = Client()
-        translation.activate('en')
+    @classmethod
+    def setUpTestData(cls):
         SiteConfiguration.get_solo()
-        # Create a test profile using helper function
-        self.profile = create_test_profile(
+        # Create a test profile using helper function (once per class)
+        cls.profile = create_test_profile(
             profile_id=2,  # Use different ID to avoid conflicts
             name="Setup User",
             title="Setup Admin",
@@ -108,11 +121,16 @@ class InitialSetupWizardTests(TestCase):
             location="Setup City"
         )
 
+    def setUp(self):
+        translation.activate('en')
+
     def test_setup_accessible_without_superuser(self):
         response = self.client.get(reverse('portfolio:initial-setup'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "First run setup")
 
+    # The test settings trim MIDDLEWARE for speed and leave the redirect out
+    @modify_settings(MIDDLEWARE={'append': 'portfolio.middleware.InitialSetupRedirectMiddleware'})
     def test_dashboard_redirects_to_setup_when_no_superuser(self):
         response = self.client.get(reverse('portfolio:admin-dashboard'))
         self.assertRedirects(
@@ -1,28 +1,29 @@
 """
 Tests for critical forms.
 """
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
+from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
-import io
-from PIL import Image
+from pathlib import Path
 
 from portfolio.forms.contact import SecureContactFormWithHoneypot
 from portfolio.forms.blog import SecureBlogPostForm
 from portfolio.forms.projects import SecureProjectForm
 from portfolio.models import Category, ProjectType, KnowledgeBase
 
+_NOW = timezone.now()
 
-def create_test_image(format='JPEG', size=(250, 250)):
-    """Helper function to create a valid test image."""
-    image = Image.new('RGB', size, color='red')
-    buffer = io.BytesIO()
-    image.save(buffer, format=format)
-    buffer.seek(0)
-    return buffer.getvalue()
+# 250x250 JPEG: large enough for the 200px minimum enforced by the image validators
+_TEST_IMAGE_BYTES = (Path(__file__).parent / 'fixtures' / 'test_image.jpg').read_bytes()
 
 
-class SecureContactFormWithHoneypotTest(TestCase):
+def create_test_image():
+    """Helper function returning a valid test JPEG."""
+    return _TEST_IMAGE_BYTES
+
+
+class SecureContactFormWithHoneypotTest(SimpleTestCase):
     """Test SecureContactFormWithHoneypot"""
 
     def test_valid_form_submission(self):
@@ -39,8 +40,7 @@ class SecureContactFormWithHoneypotTest(TestCase):
 
     def test_honeypot_field_exists(self):
         """Test that honeypot field exists in form"""
-        form = SecureContactFormWithHoneypot()
-        self.assertIn('honeypot', form.fields)
+        self.assertIn('honeypot', SecureContactFormWithHoneypot.base_fields)
 
     def test_form_rejects_missing_required_fields(self):
         """Test that form rejects missing required fields"""
@@ -52,7 +52,6 @@ class SecureContactFormWithHoneypotTest(TestCase):
             'honeypot': '',
         }
         form = SecureContactFormWithHoneypot(data=form_data)
-        self.assertFalse(form.is_valid())
         self.assertIn('name', form.errors)
 
         # Missing email
@@ -63,7 +62,6 @@ class SecureContactFormWithHoneypotTest(TestCase):
             'honeypot': '',
         }
         form = SecureContactFormWithHoneypot(data=form_data)
-        self.assertFalse(form.is_valid())
         self.assertIn('email', form.errors)
 
     def test_form_validates_email_format(self):
@@ -76,7 +74,6 @@ class SecureContactFormWithHoneypotTest(TestCase):
             'honeypot': '',
         }
         form = SecureContactFormWithHoneypot(data=form_data)
-        self.assertFalse(form.is_valid())
         self.assertIn('email', form.errors)
 
     def test_form_rejects_too_short_message(self):
@@ -89,7 +86,6 @@ class SecureContactFormWithHoneypotTest(TestCase):
             'honeypot': '',
         }
         form = SecureContactFormWithHoneypot(data=form_data)
-        self.assertFalse(form.is_valid())
         self.assertIn('message', form.errors)
 
     def test_form_accepts_long_valid_message(self):
@@ -108,13 +104,25 @@ class SecureContactFormWithHoneypotTest(TestCase):
 class SecureBlogPostFormTest(TestCase):
     """Test SecureBlogPostForm"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create category
-        self.category = Category.objects.create(slug='tech')
-        self.category.set_current_language('en')
-        self.category.name = "Technology"
-        self.category.description = "Tech posts"
-        self.category.save()
+        cls.category = Category.objects.create(
+            slug='tech',
+            _current_language='en',
+            name="Technology",
+            description="Tech posts",
+        )
+
+        cls.BASE_POST_DATA = {
+            'title': 'Test Post',
+            'content': 'Content',
+            'excerpt': 'Excerpt',
+            'category': cls.category.id,
+            'status': 'draft',
+            'reading_time': 5,
+            'publish_date': _NOW,
+        }
 
     def test_valid_form_submission(self):
         """Test that valid form data is accepted"""
@@ -124,7 +132,7 @@ class SecureBlogPostFormTest(TestCase):
             'excerpt': 'This is an excerpt.',
             'category': self.category.id,
             'status': 'published',
-            'publish_date': timezone.now(),
+            'publish_date': _NOW,
             'reading_time': 5,
             'tags': 'python, django',
         }
@@ -140,7 +148,6 @@ class SecureBlogPostFormTest(TestCase):
             'status': 'draft',
         }
         form = SecureBlogPostForm(data=form_data, language_code='en')
-        self.assertFalse(form.is_valid())
         self.assertIn('title', form.errors)
 
     def test_form_rejects_missing_content(self):
@@ -152,12 +159,11 @@ class SecureBlogPostFormTest(TestCase):
             'status': 'draft',
         }
         form = SecureBlogPostForm(data=form_data, language_code='en')
-        self.assertFalse(form.is_valid())
         self.assertIn('content', form.errors)
 
     def test_form_accepts_valid_featured_image(self):
         """Test that form accepts valid featured images"""
-        image_data = create_test_image('JPEG')
+        image_data = create_test_image()
         image = SimpleUploadedFile(
             "test.jpg",
             image_data,
@@ -165,28 +171,13 @@ class SecureBlogPostFormTest(TestCase):
         )
         image.size = len(image_data)
 
-        form_data = {
-            'title': 'Test Post',
-            'content': 'Content',
-            'excerpt': 'Excerpt',
-            'category': self.category.id,
-            'status': 'draft',
-            'reading_time': 5,
-            'publish_date': timezone.now(),
-        }
-        form = SecureBlogPostForm(data=form_data, files={'featured_image': image}, language_code='en')
+        form = SecureBlogPostForm(data=self.BASE_POST_DATA, files={'featured_image': image}, language_code='en')
         self.assertTrue(form.is_valid(), f"Form errors: {form.errors}")
 
     def test_form_allows_optional_category(self):
         """Test that category is optional"""
-        form_data = {
-            'title': 'Test Post',
-            'content': 'Content',
-            'excerpt': 'Excerpt',
-            'status': 'draft',
-            'reading_time': 5,
-            'publish_date': timezone.now(),
-        }
+        form_data = {**self.BASE_POST_DATA}
+        del form_data['category']
         form = SecureBlogPostForm(data=form_data, language_code='en')
         # Category is optional, so form should be valid without it
         self.assertTrue(form.is_valid(), f"Form errors: {form.errors}")
@@ -195,60 +186,61 @@ class SecureBlogPostFormTest(TestCase):
 class SecureProjectFormTest(TestCase):
     """Test SecureProjectForm"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create project type
-        self.project_type = ProjectType.objects.create(slug='web-app')
-        self.project_type.set_current_language('en')
-        self.project_type.name = "Web Application"
-        self.project_type.description = "Web apps"
-        self.project_type.save()
+        cls.project_type = ProjectType.objects.create(
+            slug='web-app',
+            _current_language='en',
+            name="Web Application",
+            description="Web apps",
+        )
 
         # Create knowledge base
-        self.kb = KnowledgeBase.objects.create(identifier='test-kb')
-        self.kb.set_current_language('en')
-        self.kb.name = "Test KB"
-        self.kb.save()
+        cls.kb = KnowledgeBase.objects.create(
+            identifier='test-kb',
+            _current_language='en',
+            name="Test KB",
+        )
+
+        cls.BASE_PROJECT_DATA = {
+            'title': 'Test Project',
+            'description': 'Description',
+            'detailed_description': 'Detailed description',
+            'project_type_obj': cls.project_type.id,
+            'visibility': 'public',
+            'knowledge_bases': [cls.kb.id],
+            'order': 0,
+            'featured_link_type': 'none',
+        }
 
     def test_valid_form_submission(self):
         """Test that valid form data is accepted"""
         form_data = {
-            'title': 'Test Project',
+            **self.BASE_PROJECT_DATA,
             'description': 'This is a test project description.',
             'detailed_description': 'This is a detailed description.',
-            'project_type_obj': self.project_type.id,
-            'visibility': 'public',
-            'knowledge_bases': [self.kb.id],
-            'order': 0,
-            'featured_link_type': 'none',
         }
         form = SecureProjectForm(data=form_data, language_code='en')
         self.assertTrue(form.is_valid(), f"Form errors: {form.errors}")
 
     def test_form_rejects_missing_title(self):
         """Test that form rejects missing title"""
-        form_data = {
-            'description': 'Description',
-            'project_type_obj': self.project_type.id,
-            'visibility': 'public',
-        }
+        form_data = {**self.BASE_PROJECT_DATA}
+        del form_data['title']
         form = SecureProjectForm(data=form_data, language_code='en')
-        self.assertFalse(form.is_valid())
         self.assertIn('title', form.errors)
 
     def test_form_rejects_missing_description(self):
         """Test that form rejects missing description"""
-        form_data = {
-            'title': 'Test Project',
-            'project_type_obj': self.project_type.id,
-            'visibility': 'public',
-        }
+        form_data = {**self.BASE_PROJECT_DATA}
+        del form_data['description']
         form = SecureProjectForm(data=form_data, language_code='en')
-        self.assertFalse(form.is_valid())
         self.assertIn('description', form.errors)
 
     def test_form_accepts_valid_project_image(self):
         """Test that form accepts valid project images"""
-        image_data = create_test_image('JPEG')
+        image_data = create_test_image()
         image = SimpleUploadedFile(
             "project.jpg",
             image_data,
@@ -256,65 +248,29 @@ class SecureProjectFormTest(TestCase):
         )
         image.size = len(image_data)
 
-        form_data = {
-            'title': 'Test Project',
-            'description': 'Description',
-            'detailed_description': 'Detailed description',
-            'project_type_obj': self.project_type.id,
-            'visibility': 'public',
-            'knowledge_bases': [self.kb.id],
-            'order': 0,
-            'featured_link_type': 'none',
-        }
-        form = SecureProjectForm(data=form_data, files={'image': image}, language_code='en')
+        form = SecureProjectForm(data=self.BASE_PROJECT_DATA, files={'image': image}, language_code='en')
         self.assertTrue(form.is_valid(), f"Form errors: {form.errors}")
 
     def test_form_validates_visibility_choices(self):
         """Test that form validates visibility choices"""
-        form_data = {
-            'title': 'Test Project',
-            'description': 'Description',
-            'project_type_obj': self.project_type.id,
-            'visibility': 'invalid_choice',  # Invalid choice
-        }
-        form = SecureProjectForm(data=form_data, language_code='en')
-        self.assertFalse(form.is_valid())
-        self.assertIn('visibility', form.errors)
+        field = SecureProjectForm.base_fields['visibility']
+        with self.assertRaises(ValidationError):
+            field.clean('invalid_choice')
 
     def test_form_accepts_github_url(self):
         """Test that form accepts valid GitHub URLs"""
-        form_data = {
-            'title': 'Test Project',
-            'description': 'Description',
-            'detailed_description': 'Detailed description',
-            'project_type_obj': self.project_type.id,
-            'visibility': 'public',
-            'knowledge_bases': [self.kb.id],
-            'order': 0,
-            'featured_link_type': 'none',
-            'github_url': 'https://github.com/user/repo',
-        }
+        form_data = {**self.BASE_PROJECT_DATA, 'github_url': 'https://github.com/user/repo'}
         form = SecureProjectForm(data=form_data, language_code='en')
         self.assertTrue(form.is_valid(), f"Form errors: {form.errors}")
 
     def test_form_accepts_demo_url(self):
         """Test that form accepts valid demo URLs"""
-        form_data = {
-            'title': 'Test Project',
-            'description': 'Description',
-            'detailed_description': 'Detailed description',
-            'project_type_obj': self.project_type.id,
-            'visibility': 'public',
-            'knowledge_bases': [self.kb.id],
-            'order': 0,
-            'featured_link_type': 'none',
-            'demo_url': 'https://example.com/demo',
-        }
+        form_data = {**self.BASE_PROJECT_DATA, 'demo_url': 'https://example.com/demo'}
         form = SecureProjectForm(data=form_data, language_code='en')
         self.assertTrue(form.is_valid(), f"Form errors: {form.errors}")
 
 
-class FormSecurityTest(TestCase):
+class FormSecurityTest(SimpleTestCase):
     """Test security features of forms"""
 
     def test_contact_form_strips_html_tags(self):
@@ -340,7 +296,7 @@ class FormSecurityTest(TestCase):
             'name': 'John Doe',
             'email': 'john@example.com',
             'subject': 'Test',
-            'message': 'x' * 3000,  # Very long message (over widget maxlength of 2000)
+            'message': 'x' * 2001,  # Just over the widget maxlength of 2000
             'honeypot': '',
         }
         form = SecureContactFormWithHoneypot(data=form_data)
@@ -350,18 +306,25 @@ class FormSecurityTest(TestCase):
         # So this test just verifies the form handles long messages without crashing
         self.assertTrue(isinstance(form.is_valid(), bool))
 
+
+class BlogFormSecurityTest(TestCase):
+    """Test security features of the blog form"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(
+            slug='tech',
+            _current_language='en',
+            name="Technology",
+        )
+
     def test_blog_form_sanitizes_content(self):
         """Test that blog form handles HTML content safely"""
-        category = Category.objects.create(slug='tech')
-        category.set_current_language('en')
-        category.name = "Technology"
-        category.save()
-
         form_data = {
             'title': 'Test <script>alert(1)</script>',
             'content': 'Content with <script>malicious code</script>',
             'excerpt': 'Excerpt',
-            'category': category.id,
+            'category': self.category.id,
             'status': 'draft',
         }
         form = SecureBlogPostForm(data=form_data, language_code='en')
@@ -4,30 +4,36 @@ Tests for portfolio models.
 from datetime import date, timedelta
 from django.test import TestCase
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.db import transaction
 from django.core.exceptions import ValidationError
+from parler.cache import get_object_cache_keys
+
 from portfolio.models import (
     Profile, SiteConfiguration, Project, ProjectType,
     Experience, Education, Skill, Category, BlogPost,
     Contact, KnowledgeBase, Language
 )
 
+_NOW = timezone.now()
+
 
-def create_test_profile(profile_id=1, name="Test User", title="Test Developer", bio="Test bio",
+def create_test_profile(name="Test User", title="Test Developer", bio="Test bio",
                        email="test@example.com", location="Test City", language="en"):
     """Helper function to create a test profile using raw SQL (handles legacy columns)."""
     from django.db import connection
-    with transaction.atomic():
-        cursor = connection.cursor()
-        # Insert into main table with legacy columns
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Insert into main table with legacy columns; let the sequence allocate the id
         cursor.execute(
-            "INSERT INTO portfolio_profile (id, email, phone, linkedin_url, github_url, medium_url, "
+            "INSERT INTO portfolio_profile (email, phone, linkedin_url, github_url, medium_url, "
             "profile_image, resume_pdf, resume_pdf_es, show_web_resume, created_at, updated_at, "
             "name, title, bio, location) "
-            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW(), %s, %s, %s, %s)",
-            [profile_id, email, '', '', '', '', '', '', '', True, name, title, bio, location]
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, %s, %s, %s, %s) "
+            "RETURNING id",
+            [email, '', '', '', '', '', '', '', True, name, title, bio, location]
         )
+        profile_id = cursor.fetchone()[0]
 
         # Create translations
         cursor.execute(
@@ -36,14 +42,18 @@ def create_test_profile(profile_id=1, name="Test User", title="Test Developer",
             [profile_id, language, name, title, bio, location]
         )
 
-        return Profile.objects.get(pk=profile_id)
+    profile = Profile.objects.get(pk=profile_id)
+    # Raw SQL skips parler's save hooks: drop translations cached for an earlier row with this id
+    cache.delete_many(get_object_cache_keys(profile))
+    return profile
 
 
 class ProfileModelTest(TestCase):
     """Test Profile model"""
 
-    def setUp(self):
-        self.profile = create_test_profile()
+    @classmethod
+    def setUpTestData(cls):
+        cls.profile = create_test_profile()
 
     def test_profile_creation(self):
         """Test profile is created correctly"""
@@ -53,15 +63,9 @@ class ProfileModelTest(TestCase):
 
     def test_profile_singleton(self):
         """Test that only one profile can exist"""
-        with self.assertRaises(ValidationError):
-            profile2 = Profile()
-            profile2.set_current_language('en')
-            profile2.name = "Another User"
-            profile2.title = "Another Title"
-            profile2.bio = "Another bio"
-            profile2.email = "another@example.com"
-            profile2.location = "Another City"
-            profile2.save()
+        profile2 = Profile(email="another@example.com")
+        with self.assertRaisesMessage(ValidationError, "Solo puede existir un perfil"):
+            profile2.full_clean()
 
     def test_profile_get_solo(self):
         """Test get_solo class method"""
@@ -87,9 +91,8 @@ class SiteConfigurationModelTest(TestCase):
         self.assertIsNotNone(config1)
 
         # Try to create another
-        with self.assertRaises(ValidationError):
-            config2 = SiteConfiguration()
-            config2.save()
+        with self.assertRaisesMessage(ValidationError, "Only one site configuration"):
+            SiteConfiguration().full_clean()
 
     def test_get_solo_sets_defaults(self):
         """Test get_solo sets default values"""
@@ -101,7 +104,6 @@ class SiteConfigurationModelTest(TestCase):
         """Test get_target_languages method"""
         config = SiteConfiguration.get_solo()
         config.default_language = 'en'
-        config.save()
 
         targets = config.get_target_languages()
         self.assertIsInstance(targets, list)
@@ -112,12 +114,14 @@ class SiteConfigurationModelTest(TestCase):
 class ProjectTypeModelTest(TestCase):
     """Test ProjectType model"""
 
-    def setUp(self):
-        self.project_type = ProjectType.objects.create(slug='web-app')
-        self.project_type.set_current_language('en')
-        self.project_type.name = "Web Application"
-        self.project_type.description = "Web app projects"
-        self.project_type.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.project_type = ProjectType.objects.create(
+            slug='web-app',
+            _current_language='en',
+            name="Web Application",
+            description="Web app projects",
+        )
 
     def test_project_type_creation(self):
         """Test project type is created correctly"""
@@ -142,12 +146,14 @@ class ProjectTypeModelTest(TestCase):
 class KnowledgeBaseModelTest(TestCase):
     """Test KnowledgeBase model"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Use unique identifier to avoid conflicts with default data
-        self.kb = KnowledgeBase.objects.create(identifier='test-tech-unique')
-        self.kb.set_current_language('en')
-        self.kb.name = "Test Technology"
-        self.kb.save()
+        cls.kb = KnowledgeBase.objects.create(
+            identifier='test-tech-unique',
+            _current_language='en',
+            name="Test Technology",
+        )
 
     def test_knowledge_base_creation(self):
         """Test knowledge base is created correctly"""
@@ -162,20 +168,22 @@ class KnowledgeBaseModelTest(TestCase):
 class ProjectModelTest(TestCase):
     """Test Project model"""
 
-    def setUp(self):
-        self.project_type = ProjectType.objects.create(slug='web-app')
-        self.project_type.set_current_language('en')
-        self.project_type.name = "Web Application"
-        self.project_type.description = "Web app projects"
-        self.project_type.save()
-
-        self.project = Project()
-        self.project.set_current_language('en')
-        self.project.title = "Test Project"
-        self.project.description = "A test project"
-        self.project.project_type_obj = self.project_type
-        self.project.visibility = 'public'
-        self.project.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.project_type = ProjectType.objects.create(
+            slug='web-app',
+            _current_language='en',
+            name="Web Application",
+            description="Web app projects",
+        )
+
+        cls.project = Project()
+        cls.project.set_current_language('en')
+        cls.project.title = "Test Project"
+        cls.project.description = "A test project"
+        cls.project.project_type_obj = cls.project_type
+        cls.project.visibility = 'public'
+        cls.project.save()
 
     def test_project_creation(self):
         """Test project is created correctly"""
@@ -199,12 +207,14 @@ class ProjectModelTest(TestCase):
 class CategoryModelTest(TestCase):
     """Test Category model"""
 
-    def setUp(self):
-        self.category = Category.objects.create(slug='tech')
-        self.category.set_current_language('en')
-        self.category.name = "Technology"
-        self.category.description = "Tech posts"
-        self.category.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(
+            slug='tech',
+            _current_language='en',
+            name="Technology",
+            description="Tech posts",
+        )
 
     def test_category_creation(self):
         """Test category is created correctly"""
@@ -229,22 +239,24 @@ class CategoryModelTest(TestCase):
 class BlogPostModelTest(TestCase):
     """Test BlogPost model"""
 
-    def setUp(self):
-        self.category = Category.objects.create(slug='tech')
-        self.category.set_current_language('en')
-        self.category.name = "Technology"
-        self.category.description = "Tech posts"
-        self.category.save()
-
-        self.post = BlogPost()
-        self.post.set_current_language('en')
-        self.post.title = "Test Post"
-        self.post.content = "This is a test post content."
-        self.post.excerpt = "Test excerpt"
-        self.post.category = self.category
-        self.post.status = 'published'
-        self.post.publish_date = timezone.now()
-        self.post.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(
+            slug='tech',
+            _current_language='en',
+            name="Technology",
+            description="Tech posts",
+        )
+
+        cls.post = BlogPost()
+        cls.post.set_current_language('en')
+        cls.post.title = "Test Post"
+        cls.post.content = "This is a test post content."
+        cls.post.excerpt = "Test excerpt"
+        cls.post.category = cls.category
+        cls.post.status = 'published'
+        cls.post.publish_date = _NOW
+        cls.post.save()
 
     def test_blog_post_creation(self):
         """Test blog post is created correctly"""
@@ -285,15 +297,16 @@ class BlogPostModelTest(TestCase):
 class ExperienceModelTest(TestCase):
     """Test Experience model"""
 
-    def setUp(self):
-        self.experience = Experience()
-        self.experience.set_current_language('en')
-        self.experience.company = "Test Company"
-        self.experience.position = "Software Engineer"
-        self.experience.description = "Working on projects"
-        self.experience.start_date = date(2020, 1, 1)
-        self.experience.current = True
-        self.experience.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.experience = Experience()
+        cls.experience.set_current_language('en')
+        cls.experience.company = "Test Company"
+        cls.experience.position = "Software Engineer"
+        cls.experience.description = "Working on projects"
+        cls.experience.start_date = date(2020, 1, 1)
+        cls.experience.current = True
+        cls.experience.save()
 
     def test_experience_creation(self):
         """Test experience is created correctly"""
@@ -317,17 +330,18 @@ class ExperienceModelTest(TestCase):
 class EducationModelTest(TestCase):
     """Test Education model"""
 
-    def setUp(self):
-        self.education = Education()
-        self.education.set_current_language('en')
-        self.education.institution = "Test University"
-        self.education.degree = "Bachelor of Science"
-        self.education.field_of_study = "Computer Science"
-        self.education.description = "CS degree"
-        self.education.start_date = date(2016, 9, 1)
-        self.education.end_date = date(2020, 6, 30)
-        self.education.education_type = 'formal'
-        self.education.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.education = Education()
+        cls.education.set_current_language('en')
+        cls.education.institution = "Test University"
+        cls.education.degree = "Bachelor of Science"
+        cls.education.field_of_study = "Computer Science"
+        cls.education.description = "CS degree"
+        cls.education.start_date = date(2016, 9, 1)
+        cls.education.end_date = date(2020, 6, 30)
+        cls.education.education_type = 'formal'
+        cls.education.save()
 
     def test_education_creation(self):
         """Test education is created correctly"""
@@ -343,14 +357,15 @@ class EducationModelTest(TestCase):
 class SkillModelTest(TestCase):
     """Test Skill model"""
 
-    def setUp(self):
-        self.skill = Skill()
-        self.skill.set_current_language('en')
-        self.skill.name = "Python"
-        self.skill.proficiency = 4
-        self.skill.years_experience = 5
-        self.skill.category = "Programming Languages"
-        self.skill.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.skill = Skill()
+        cls.skill.set_current_language('en')
+        cls.skill.name = "Python"
+        cls.skill.proficiency = 4
+        cls.skill.years_experience = 5
+        cls.skill.category = "Programming Languages"
+        cls.skill.save()
 
     def test_skill_creation(self):
         """Test skill is created correctly"""
@@ -367,42 +382,37 @@ class SkillModelTest(TestCase):
 class ContactModelTest(TestCase):
     """Test Contact model"""
 
-    def test_contact_creation(self):
-        """Test contact is created correctly"""
-        contact = Contact.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.contact = Contact.objects.create(
             name="John Doe",
             email="john@example.com",
             subject="Test Subject",
             message="Test message"
         )
 
-        self.assertEqual(contact.name, "John Doe")
-        self.assertFalse(contact.read)
+    def test_contact_creation(self):
+        """Test contact is created correctly"""
+        self.assertEqual(self.contact.name, "John Doe")
+        self.assertFalse(self.contact.read)
 
     def test_contact_str(self):
         """Test string representation"""
-        contact = Contact.objects.create(
-            name="John Doe",
-            email="john@example.com",
-            subject="Test Subject",
-            message="Test message"
-        )
-
         expected = "John Doe - Test Subject"
-        self.assertEqual(str(contact), expected)
+        self.assertEqual(str(self.contact), expected)
 
 
 class LanguageModelTest(TestCase):
     """Test Language model"""
 
-    def setUp(self):
-        self.language = Language.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.language = Language.objects.create(
             code="en",
-            proficiency="Native"
+            proficiency="Native",
+            _current_language='en',
+            name="English",
         )
-        self.language.set_current_language('en')
-        self.language.name = "English"
-        self.language.save()
 
     def test_language_creation(self):
         """Test language is created correctly"""
@@ -0,0 +1,81 @@
+"""
+Tests for custom template tags and filters.
+"""
+from unittest import mock
+
+from django.core.cache import cache
+from django.template import engines
+from django.test import SimpleTestCase
+
+from portfolio.templatetags import markdown_extras
+from portfolio.templatetags.markdown_extras import markdown_filter
+
+
+class MarkdownFilterTest(SimpleTestCase):
+    """Test the markdown template filter"""
+
+    def setUp(self):
+        cache.clear()
+        markdown_extras._render.cache_clear()
+
+    def test_filter_resolves_to_cached_implementation(self):
+        """Test that {% load markdown_extras %} exposes the cached filter"""
+        libraries = engines['django'].engine.template_libraries
+        self.assertIs(libraries['markdown_extras'].filters['markdown'], markdown_filter)
+
+    def test_renders_markdown(self):
+        """Test that Markdown is converted to HTML"""
+        result = markdown_filter("# Title\n\nSome **bold** text")
+        self.assertIn('<h1 id="title">Title</h1>', result)
+        self.assertIn('<strong>bold</strong>', result)
+
+    def test_renders_tables_and_fenced_code(self):
+        """Test that tables and fenced code blocks are supported (via 'extra')"""
+        result = markdown_filter("| a | b |\n|---|---|\n| 1 | 2 |\n\n```python\nx = 1\n```")
+        self.assertIn('<table>', result)
+        self.assertIn('<code class="language-python">', result)
+
+    def test_empty_value(self):
+        """Test that empty input renders an empty string"""
+        self.assertEqual(markdown_filter(""), "")
+
+    def test_unescapes_html_entities(self):
+        """Test that escaped entities are unescaped before rendering"""
+        result = markdown_filter("a &gt; b")
+        self.assertIn('a &gt; b', result)
+        self.assertNotIn('&amp;gt;', result)
+
+    def test_repeated_content_is_not_reparsed(self):
+        """Test that rendering the same content twice only parses it once"""
+        with mock.patch.object(markdown_extras, '_convert', wraps=markdown_extras._convert) as convert:
+            first = markdown_filter("Cached *content*")
+            second = markdown_filter("Cached *content*")
+
+        self.assertEqual(first, second)
+        self.assertEqual(convert.call_count, 1)
+
+    def test_shared_cache_is_used_when_process_cache_misses(self):
+        """Test that another process (empty LRU) reuses the shared cache"""
+        markdown_filter("Shared *content*")
+        markdown_extras._render.cache_clear()
+
+        with mock.patch.object(markdown_extras, '_convert') as convert:
+            result = markdown_filter("Shared *content*")
+
+        convert.assert_not_called()
+        self.assertIn('<em>content</em>', result)
+
+    def test_process_cache_skips_shared_cache(self):
+        """Test that repeated renders in one process do not hit the shared cache"""
+        markdown_filter("Local *content*")
+
+        with mock.patch.object(markdown_extras.cache, 'get_or_set') as get_or_set:
+            markdown_filter("Local *content*")
+
+        get_or_set.assert_not_called()
+
+    def test_renderer_state_is_reset_between_documents(self):
+        """Test that the reused renderer does not leak state across documents"""
+        markdown_filter("# Same heading")
+        result = markdown_filter("# Same heading\n\nother")
+        self.assertIn('<h1 id="same-heading">', result)
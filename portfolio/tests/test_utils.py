@@ -0,0 +1,150 @@
+"""
+Tests for portfolio utility helpers.
+"""
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from portfolio.models import BlogPost, Contact, Education, PageVisit, Project, ProjectType, Skill
+from portfolio.utils.analytics import get_analytics_summary
+from portfolio.utils.resume import get_education_summary, get_skills_summary
+
+
+class AnalyticsSummaryTest(TestCase):
+    """Test the analytics summary helper"""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        for age in (timedelta(0), timedelta(days=3), timedelta(days=20), timedelta(days=60)):
+            visit = PageVisit.objects.create(
+                page_url='/', page_title='Home', ip_address='127.0.0.1', user_agent='test'
+            )
+            # timestamp is auto_now_add, so age the row afterwards
+            PageVisit.objects.filter(pk=visit.pk).update(timestamp=now - age)
+
+        BlogPost.objects.language('en').create(
+            title="Published", content="Content", status='published', publish_date=now
+        )
+        BlogPost.objects.language('en').create(
+            title="Draft", content="Content", status='draft', publish_date=now
+        )
+
+        project_type = ProjectType.objects.create(slug='web-app', _current_language='en', name="Web")
+        for visibility in ('public', 'private'):
+            project = Project()
+            project.set_current_language('en')
+            project.title = f"{visibility} project"
+            project.description = "A test project"
+            project.project_type_obj = project_type
+            project.visibility = visibility
+            project.save()
+
+        Contact.objects.create(name="A", email="a@example.com", subject="S", message="M")
+        Contact.objects.create(name="B", email="b@example.com", subject="S", message="M", read=True)
+
+    def test_summary_counts(self):
+        """Test that every figure is counted from its own filter"""
+        self.assertEqual(get_analytics_summary(), {
+            'total_visits': 4,
+            'today_visits': 1,
+            'week_visits': 2,
+            'month_visits': 3,
+            'total_posts': 2,
+            'published_posts': 1,
+            'total_projects': 2,
+            'public_projects': 1,
+            'total_messages': 2,
+            'unread_messages': 1,
+        })
+
+    def test_summary_uses_one_query_per_model(self):
+        """Test that the counts are fused into one aggregate per model"""
+        with self.assertNumQueries(4):
+            get_analytics_summary()
+
+
+def create_education(degree, education_type, end_date):
+    education = Education()
+    education.set_current_language('en')
+    education.institution = "Test University"
+    education.degree = degree
+    education.field_of_study = "Computer Science"
+    education.start_date = date(end_date.year - 1, 1, 1)
+    education.end_date = end_date
+    education.education_type = education_type
+    education.save()
+    return education
+
+
+def create_skill(name, proficiency, category, years_experience=1):
+    skill = Skill()
+    skill.set_current_language('en')
+    skill.name = name
+    skill.proficiency = proficiency
+    skill.years_experience = years_experience
+    skill.category = category
+    skill.save()
+    return skill
+
+
+class EducationSummaryTest(TestCase):
+    """Test the education summary helper"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_education("BSc", 'formal', date(2016, 6, 30))
+        cls.latest_formal = create_education("MSc", 'formal', date(2019, 6, 30))
+        cls.latest_certification = create_education("Cloud Cert", 'certification', date(2021, 3, 1))
+        create_education("Python Course", 'online_course', date(2020, 5, 1))
+        create_education("Bootcamp", 'bootcamp', date(2018, 8, 1))
+        create_education("Workshop", 'workshop', date(2017, 2, 1))
+
+    def test_summary_counts_and_latest_entries(self):
+        """Test counts per type and the most recent formal/certification entries"""
+        summary = get_education_summary()
+
+        self.assertEqual(summary['formal_count'], 2)
+        self.assertEqual(summary['certification_count'], 1)
+        self.assertEqual(summary['course_count'], 1)
+        self.assertEqual(summary['bootcamp_count'], 2)
+        self.assertEqual(summary['total_count'], 6)
+        self.assertEqual(summary['latest_formal'], self.latest_formal)
+        self.assertEqual(summary['latest_certification'], self.latest_certification)
+
+    def test_summary_uses_two_queries(self):
+        """Test one aggregate for the counts and one ordered fetch for both latest entries"""
+        with self.assertNumQueries(2):
+            get_education_summary()
+
+
+class SkillsSummaryTest(TestCase):
+    """Test the skills summary helper"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.python = create_skill("Python", 4, "Programming Languages", years_experience=6)
+        cls.go = create_skill("Go", 3, "Programming Languages", years_experience=2)
+        create_skill("Docker", 2, "DevOps")
+
+    def test_summary_counts_and_top_skills(self):
+        """Test proficiency counts and that top skills only include advanced/expert"""
+        with self.assertNumQueries(1):
+            summary = get_skills_summary()
+
+        self.assertEqual(summary['total_count'], 3)
+        self.assertEqual(summary['expert_count'], 1)
+        self.assertEqual(summary['advanced_count'], 1)
+        self.assertEqual(list(summary['top_skills']), [self.python, self.go])
+
+    def test_shared_category_listed_once(self):
+        """Test that a category shared by several skills is returned once"""
+        # A second translation adds another joined row for Meta.ordering to trip over
+        self.python.set_current_language('es')
+        self.python.name = "Python (es)"
+        self.python.save()
+
+        categories = list(get_skills_summary()['categories'])
+
+        self.assertEqual(categories, ['DevOps', 'Programming Languages'])
@@ -1,51 +1,69 @@
 """
 Tests for public views (non-admin).
 """
-from django.test import TestCase, Client
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone, translation
 from django.contrib.auth import get_user_model
-from django.db import connection, transaction
+from django.db import connection
+
+from parler.cache import get_object_cache_keys
 
 from portfolio.models import (
     Profile, Project, ProjectType, BlogPost, Category,
     KnowledgeBase, Contact, SiteConfiguration
 )
+from portfolio.sitemaps import get_static_lastmod
 
 User = get_user_model()
 
+# The superusers below only exist to bypass the setup redirect; skip PBKDF2 even
+# when the suite runs under development settings (plain ``manage.py test``).
+FAST_HASHERS = override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+
 
 def create_test_profile(profile_id=1, name="Test User", title="Test Developer", bio="Test bio",
                        email="test@example.com", location="Test City", language="en"):
     """Helper function to create a test profile using raw SQL (handles legacy columns)."""
-    with transaction.atomic():
-        cursor = connection.cursor()
-        # Insert into main table with legacy columns
+    with connection.cursor() as cursor:
+        # Insert the main row (with legacy columns) and its translation in one round-trip
         cursor.execute(
+            "WITH profile AS ("
             "INSERT INTO portfolio_profile (id, email, phone, linkedin_url, github_url, medium_url, "
             "profile_image, resume_pdf, resume_pdf_es, show_web_resume, created_at, updated_at, "
             "name, title, bio, location) "
-            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW(), %s, %s, %s, %s)",
-            [profile_id, email, '', '', '', '', '', '', '', True, name, title, bio, location]
-        )
-
-        # Create translations
-        cursor.execute(
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW(), %s, %s, %s, %s) "
+            "RETURNING id"
+            ") "
             "INSERT INTO portfolio_profile_translation (master_id, language_code, name, title, bio, location) "
-            "VALUES (%s, %s, %s, %s, %s, %s)",
-            [profile_id, language, name, title, bio, location]
+            "SELECT id, %s, %s, %s, %s, %s FROM profile",
+            [profile_id, email, '', '', '', '', '', '', '', True, name, title, bio, location,
+             language, name, title, bio, location]
         )
 
-        return Profile.objects.get(pk=profile_id)
+    profile = Profile.objects.get(pk=profile_id)
+    # Raw SQL skips parler's save hooks: drop translations cached for an earlier row with this id
+    cache.delete_many(get_object_cache_keys(profile))
+    return profile
 
 
+@FAST_HASHERS
 class HomeViewTest(TestCase):
     """Test HomeView"""
 
-    def setUp(self):
-        self.client = Client()
-        self.profile = create_test_profile()
-        translation.activate('en')
+    @classmethod
+    def setUpTestData(cls):
+        cls.profile = create_test_profile()
 
         # Create superuser to bypass setup redirect middleware
         User = get_user_model()
@@ -56,28 +74,34 @@ class HomeViewTest(TestCase):
         )
 
         # Create project type
-        self.project_type = ProjectType.objects.create(slug='web-app')
-        self.project_type.set_current_language('en')
-        self.project_type.name = "Web Application"
-        self.project_type.description = "Web apps"
-        self.project_type.save()
+        cls.project_type = ProjectType.objects.create(slug='web-app')
+        cls.project_type.set_current_language('en')
+        cls.project_type.name = "Web Application"
+        cls.project_type.description = "Web apps"
+        cls.project_type.save()
+
+        with translation.override('en'):
+            cls.url = reverse('portfolio:home')
+
+    def setUp(self):
+        translation.activate('en')
 
     def test_home_view_loads(self):
         """Test that home view loads successfully"""
-        response = self.client.get(reverse('portfolio:home'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'portfolio/home.html')
 
     def test_home_view_has_profile(self):
         """Test that home view includes profile in context"""
-        response = self.client.get(reverse('portfolio:home'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertIn('profile', response.context)
         self.assertEqual(response.context['profile'].email, 'test@example.com')
 
     def test_home_view_has_contact_form(self):
         """Test that home view includes contact form"""
-        response = self.client.get(reverse('portfolio:home'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertIn('contact_form', response.context)
 
@@ -90,7 +114,7 @@ class HomeViewTest(TestCase):
             'message': 'Test message',
             'honeypot': '',  # Honeypot field should be empty
         }
-        response = self.client.post(reverse('portfolio:home'), data)
+        response = self.client.post(self.url, data)
 
         # Should redirect after successful submission
         self.assertEqual(response.status_code, 302)
@@ -110,7 +134,7 @@ class HomeViewTest(TestCase):
             'message': 'Spam message',
             'honeypot': 'http://spam.com',  # Honeypot filled = spam
         }
-        response = self.client.post(reverse('portfolio:home'), data)
+        response = self.client.post(self.url, data)
 
         # Should redirect (appears to succeed)
         self.assertEqual(response.status_code, 302)
@@ -120,19 +144,19 @@ class HomeViewTest(TestCase):
 
     def test_home_view_has_projects_context(self):
         """Test that home view has projects pagination"""
-        response = self.client.get(reverse('portfolio:home'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertIn('projects', response.context)
         self.assertIn('projects_paginator', response.context)
 
 
+@FAST_HASHERS
 class BlogListViewTest(TestCase):
     """Test BlogListView"""
 
-    def setUp(self):
-        self.client = Client()
-        self.profile = create_test_profile()
-        translation.activate('en')
+    @classmethod
+    def setUpTestData(cls):
+        cls.profile = create_test_profile()
 
         # Create superuser to bypass setup redirect middleware
         User.objects.create_superuser(
@@ -142,50 +166,54 @@ class BlogListViewTest(TestCase):
         )
 
         # Create category
-        self.category = Category.objects.create(slug='tech')
-        self.category.set_current_language('en')
-        self.category.name = "Technology"
-        self.category.description = "Tech posts"
-        self.category.save()
+        cls.category = Category.objects.create(slug='tech')
+        cls.category.set_current_language('en')
+        cls.category.name = "Technology"
+        cls.category.description = "Tech posts"
+        cls.category.save()
 
         # Create published post
-        self.post = BlogPost()
-        self.post.set_current_language('en')
-        self.post.title = "Test Post"
-        self.post.content = "Test content"
-        self.post.excerpt = "Test excerpt"
-        self.post.category = self.category
-        self.post.status = 'published'
-        self.post.publish_date = timezone.now()
-        self.post.save()
+        cls.post = BlogPost.objects.language('en').create(
+            title="Test Post",
+            content="Test content",
+            excerpt="Test excerpt",
+            category=cls.category,
+            status='published',
+            publish_date=timezone.now(),
+        )
+
+        # Draft post that must stay hidden from public views
+        cls.draft = BlogPost.objects.language('en').create(
+            title="Draft Post",
+            content="Draft content",
+            excerpt="Draft excerpt",
+            category=cls.category,
+            status='draft',
+            publish_date=timezone.now(),  # Required even for drafts
+        )
+
+        with translation.override('en'):
+            cls.url = reverse('portfolio:post-list')
+
+    def setUp(self):
+        translation.activate('en')
 
     def test_blog_list_view_loads(self):
         """Test that blog list view loads successfully"""
-        response = self.client.get(reverse('portfolio:post-list'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'portfolio/blog_list.html')
 
     def test_blog_list_view_shows_published_posts(self):
         """Test that only published posts are shown"""
-        response = self.client.get(reverse('portfolio:post-list'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertIn('posts', response.context)
         self.assertEqual(len(response.context['posts']), 1)
 
     def test_blog_list_view_hides_draft_posts(self):
         """Test that draft posts are not shown"""
-        # Create draft post
-        draft = BlogPost()
-        draft.set_current_language('en')
-        draft.title = "Draft Post"
-        draft.content = "Draft content"
-        draft.excerpt = "Draft excerpt"
-        draft.category = self.category
-        draft.status = 'draft'
-        draft.publish_date = timezone.now()  # Required even for drafts
-        draft.save()
-
-        response = self.client.get(reverse('portfolio:post-list'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         # Should only show the published post
         self.assertEqual(len(response.context['posts']), 1)
@@ -193,18 +221,18 @@ class BlogListViewTest(TestCase):
 
     def test_blog_list_view_filter_by_category(self):
         """Test filtering posts by category"""
-        response = self.client.get(reverse('portfolio:post-list') + '?category=tech')
+        response = self.client.get(self.url + '?category=tech')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['posts']), 1)
 
 
+@FAST_HASHERS
 class BlogDetailViewTest(TestCase):
     """Test BlogDetailView"""
 
-    def setUp(self):
-        self.client = Client()
-        self.profile = create_test_profile()
-        translation.activate('en')
+    @classmethod
+    def setUpTestData(cls):
+        cls.profile = create_test_profile()
 
         # Create superuser to bypass setup redirect middleware
         User.objects.create_superuser(
@@ -214,55 +242,56 @@ class BlogDetailViewTest(TestCase):
         )
 
         # Create category
-        self.category = Category.objects.create(slug='tech')
-        self.category.set_current_language('en')
-        self.category.name = "Technology"
-        self.category.description = "Tech posts"
-        self.category.save()
+        cls.category = Category.objects.create(slug='tech')
+        cls.category.set_current_language('en')
+        cls.category.name = "Technology"
+        cls.category.description = "Tech posts"
+        cls.category.save()
 
         # Create published post
-        self.post = BlogPost()
-        self.post.set_current_language('en')
-        self.post.title = "Test Post"
-        self.post.content = "Test content with enough words to have a reading time."
-        self.post.excerpt = "Test excerpt"
-        self.post.category = self.category
-        self.post.status = 'published'
-        self.post.publish_date = timezone.now()
-        self.post.save()
+        cls.post = BlogPost.objects.language('en').create(
+            title="Test Post",
+            content="Test content with enough words to have a reading time.",
+            excerpt="Test excerpt",
+            category=cls.category,
+            status='published',
+            publish_date=timezone.now(),
+        )
+
+        # Draft post that must stay hidden from public views
+        cls.draft = BlogPost.objects.language('en').create(
+            title="Draft Post",
+            content="Draft content",
+            excerpt="Draft excerpt",
+            category=cls.category,
+            status='draft',
+            publish_date=timezone.now(),  # Required even for drafts
+        )
+
+        with translation.override('en'):
+            cls.url = reverse('portfolio:post-detail', kwargs={'slug': cls.post.slug})
+            cls.draft_url = reverse('portfolio:post-detail', kwargs={'slug': cls.draft.slug})
+
+    def setUp(self):
+        translation.activate('en')
 
     def test_blog_detail_view_loads(self):
         """Test that blog detail view loads successfully"""
-        response = self.client.get(
-            reverse('portfolio:post-detail', kwargs={'slug': self.post.slug})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'portfolio/blog_detail.html')
 
     def test_blog_detail_view_shows_post_content(self):
         """Test that post content is displayed"""
-        response = self.client.get(
-            reverse('portfolio:post-detail', kwargs={'slug': self.post.slug})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Test Post")
-        self.assertContains(response, "Test content")
+        body = response.content.decode()
+        self.assertIn("Test Post", body)
+        self.assertIn("Test content", body)
 
     def test_blog_detail_view_404_for_draft(self):
         """Test that draft posts return 404"""
-        draft = BlogPost()
-        draft.set_current_language('en')
-        draft.title = "Draft Post"
-        draft.content = "Draft content"
-        draft.excerpt = "Draft excerpt"
-        draft.category = self.category
-        draft.status = 'draft'
-        draft.publish_date = timezone.now()  # Required even for drafts
-        draft.save()
-
-        response = self.client.get(
-            reverse('portfolio:post-detail', kwargs={'slug': draft.slug})
-        )
+        response = self.client.get(self.draft_url)
         self.assertEqual(response.status_code, 404)
 
 
@@ -270,13 +299,13 @@ class BlogDetailViewTest(TestCase):
 # Projects are displayed on the home page instead
 
 
+@FAST_HASHERS
 class ProjectDetailViewTest(TestCase):
     """Test ProjectDetailView"""
 
-    def setUp(self):
-        self.client = Client()
-        self.profile = create_test_profile()
-        translation.activate('en')
+    @classmethod
+    def setUpTestData(cls):
+        cls.profile = create_test_profile()
 
         # Create superuser to bypass setup redirect middleware
         User.objects.create_superuser(
@@ -286,67 +315,61 @@ class ProjectDetailViewTest(TestCase):
         )
 
         # Create project type
-        self.project_type = ProjectType.objects.create(slug='web-app')
-        self.project_type.set_current_language('en')
-        self.project_type.name = "Web Application"
-        self.project_type.description = "Web apps"
-        self.project_type.save()
+        cls.project_type = ProjectType.objects.create(slug='web-app')
+        cls.project_type.set_current_language('en')
+        cls.project_type.name = "Web Application"
+        cls.project_type.description = "Web apps"
+        cls.project_type.save()
 
         # Create public project
-        self.project = Project()
-        self.project.set_current_language('en')
-        self.project.title = "Test Project"
-        self.project.description = "Detailed project description"
-        self.project.project_type_obj = self.project_type
-        self.project.visibility = 'public'
-        self.project.save()
+        cls.project = Project()
+        cls.project.set_current_language('en')
+        cls.project.title = "Test Project"
+        cls.project.description = "Detailed project description"
+        cls.project.project_type_obj = cls.project_type
+        cls.project.visibility = 'public'
+        cls.project.save()
+
+        # Private project that must stay hidden from public views
+        cls.private = Project()
+        cls.private.set_current_language('en')
+        cls.private.title = "Private Project"
+        cls.private.description = "Private description"
+        cls.private.project_type_obj = cls.project_type
+        cls.private.visibility = 'private'
+        cls.private.save()
+
+        with translation.override('en'):
+            cls.url = reverse('portfolio:project-detail', kwargs={'slug': cls.project.slug})
+            cls.private_url = reverse('portfolio:project-detail', kwargs={'slug': cls.private.slug})
+
+    def setUp(self):
+        translation.activate('en')
 
     def test_project_detail_view_loads(self):
         """Test that project detail view loads successfully"""
-        response = self.client.get(
-            reverse('portfolio:project-detail', kwargs={'slug': self.project.slug})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'portfolio/project_detail.html')
 
     def test_project_detail_view_shows_content(self):
         """Test that project content is displayed"""
-        response = self.client.get(
-            reverse('portfolio:project-detail', kwargs={'slug': self.project.slug})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Test Project")
-        self.assertContains(response, "Detailed project description")
+        body = response.content.decode()
+        self.assertIn("Test Project", body)
+        self.assertIn("Detailed project description", body)
 
     def test_project_detail_view_404_for_private(self):
         """Test that private projects return 404"""
-        private = Project()
-        private.set_current_language('en')
-        private.title = "Private Project"
-        private.description = "Private description"
-        private.project_type_obj = self.project_type
-        private.visibility = 'private'
-        private.save()
-
-        response = self.client.get(
-            reverse('portfolio:project-detail', kwargs={'slug': private.slug})
-        )
+        response = self.client.get(self.private_url)
         self.assertEqual(response.status_code, 404)
 
 
+@override_settings(MIDDLEWARE=[m for m in settings.MIDDLEWARE if 'SetupRedirect' not in m])
 class RobotsAndSEOViewsTest(TestCase):
     """Test robots.txt and other SEO views"""
 
-    def setUp(self):
-        self.client = Client()
-
-        # Create superuser to bypass setup redirect middleware
-        User.objects.create_superuser(
-            username='admin',
-            email='admin@example.com',
-            password='testpass123'
-        )
-
     def test_robots_txt_view(self):
         """Test robots.txt view"""
         response = self.client.get('/robots.txt')
@@ -360,3 +383,131 @@ class RobotsAndSEOViewsTest(TestCase):
         response = self.client.get('/manifest.json')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['Content-Type'], 'application/json')
+
+
+@FAST_HASHERS
+class SitemapViewTest(TestCase):
+    """Test sitemap.xml generation"""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Create superuser to bypass setup redirect middleware
+        User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='testpass123'
+        )
+
+        cls.category = Category.objects.create(slug='tech')
+        cls.category.set_current_language('en')
+        cls.category.name = "Technology"
+        cls.category.save()
+
+        cls.post = BlogPost.objects.language('en').create(
+            title="Sitemap Post",
+            content="Sitemap content",
+            excerpt="Sitemap excerpt",
+            category=cls.category,
+            status='published',
+            publish_date=timezone.now(),
+        )
+
+    def setUp(self):
+        cache.clear()
+        translation.activate('en')
+
+    def test_sitemap_lists_public_content(self):
+        """Test that sitemap includes published posts and active categories"""
+        response = self.client.get('/sitemap.xml')
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, self.post.get_absolute_url())
+        self.assertContains(response, '?category=tech')
+
+    def test_sitemap_lists_categories_per_language(self):
+        """Test that categories are listed once per translated language"""
+        self.category.set_current_language('es')
+        self.category.name = "Tecnologia"
+        self.category.save()
+
+        response = self.client.get('/sitemap.xml')
+        self.assertContains(response, '://testserver/posts/?category=tech')
+        self.assertContains(response, '/es/posts/?category=tech')
+
+    def test_sitemap_query_count_does_not_grow_with_content(self):
+        """Test that sitemap rows do not trigger per-object translation queries"""
+        # Warm up first-request work (site profile/config creation)
+        self.client.get('/sitemap.xml')
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get('/sitemap.xml')
+
+        for index in range(3):
+            BlogPost.objects.language('en').create(
+                title=f"Extra Post {index}",
+                content="Extra content",
+                excerpt="Extra excerpt",
+                category=self.category,
+                status='published',
+                publish_date=timezone.now(),
+            )
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/sitemap.xml')
+
+        self.assertContains(response, 'extra-post-2')
+        self.assertEqual(len(queries), len(baseline))
+
+    def test_static_lastmod_tracks_latest_content(self):
+        """Test that static pages report the latest content change as lastmod"""
+        self.assertEqual(get_static_lastmod(), self.post.updated_at)
+
+        self.post.reading_time = 7
+        self.post.save()
+        self.assertEqual(get_static_lastmod(), self.post.updated_at)
+
+    def test_static_lastmod_refreshed_by_admin_bulk_actions(self):
+        """Test that admin bulk status changes (no signals) refresh lastmod"""
+        from django.contrib.admin.sites import site
+        from portfolio.admin.blog import BlogPostAdmin
+
+        self.assertEqual(get_static_lastmod(), self.post.updated_at)
+
+        model_admin = BlogPostAdmin(BlogPost, site)
+        with mock.patch.object(model_admin, 'message_user'):
+            model_admin.mark_as_draft(None, BlogPost.objects.filter(pk=self.post.pk))
+
+        self.assertIsNone(get_static_lastmod())
+
+    def test_warm_sitemap_writes_files(self):
+        """Test that warm_sitemap pre-renders the sitemap"""
+        with tempfile.TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            call_command('warm_sitemap', domain='example.com', stdout=StringIO())
+
+            output_dir = os.path.join(media_root, 'sitemaps')
+            with open(os.path.join(output_dir, 'sitemap.xml')) as fh:
+                content = fh.read()
+
+        self.assertIn('https://example.com' + self.post.get_absolute_url(), content)
+
+    def test_warm_sitemap_insecure_uses_http(self):
+        """Test that --insecure renders http:// URLs for the given domain"""
+        with tempfile.TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            call_command('warm_sitemap', domain='example.com', insecure=True, stdout=StringIO())
+
+            with open(os.path.join(media_root, 'sitemaps', 'sitemap.xml')) as fh:
+                content = fh.read()
+
+        self.assertIn('http://example.com' + self.post.get_absolute_url(), content)
+        self.assertNotIn('https://', content)
+
+    @override_settings(ALLOWED_HOSTS=['portfolio.example'])
+    def test_warm_sitemap_checks_domain_against_allowed_hosts(self):
+        """Test that --domain must be a host the site actually serves"""
+        with tempfile.TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            call_command('warm_sitemap', domain='portfolio.example', stdout=StringIO())
+            self.assertTrue(os.path.exists(os.path.join(media_root, 'sitemaps', 'sitemap.xml')))
+
+            with self.assertRaisesMessage(CommandError, 'not in ALLOWED_HOSTS'):
+                call_command('warm_sitemap', domain='other.example', stdout=StringIO())
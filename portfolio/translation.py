@@ -1,6 +1,8 @@
 """
 Utilities to trigger automatic translations for translatable models.
 """
+import hashlib
+import json
 import logging
 from typing import Dict, Tuple, Type
 
@@ -11,6 +13,7 @@ from django.utils import translation as django_translation
 from django.core.exceptions import ImproperlyConfigured
 
 from markdownify import MarkdownConverter
+from parler.models import TranslationDoesNotExist
 
 class CustomMarkdownConverter(MarkdownConverter):
     """
@@ -80,60 +83,89 @@ AUTO_TRANSLATABLE_MODELS: Dict[Type, AutoFields] = {
     },
 }
 
+# Columns refreshed when an AutoTranslationRecord upsert hits an existing row
+RECORD_UPSERT_FIELDS = [
+    'source_language',
+    'provider',
+    'duration_ms',
+    'auto_generated',
+    'status',
+    'error_message',
+    'source_hash',
+    'updated_at',
+]
 
-def schedule_auto_translation(instance):
-    """Schedule translation after the current transaction commits."""
+
+def _get_content_type(model: Type) -> ContentType:
+    """
+    Resolve the ContentType of a translatable model.
+    A cold ContentTypeManager cache is filled for every auto-translatable model
+    in one query, so later runs for the other models don't each pay a SELECT.
+    """
+    return ContentType.objects.get_for_models(*AUTO_TRANSLATABLE_MODELS)[model]
+
+
+def schedule_auto_translation(instance, config=None):
+    """
+    Schedule translation after the current transaction commits.
+    Callers that already loaded the SiteConfiguration can pass it to avoid another lookup;
+    the same object is handed to the deferred run.
+    """
     model = instance.__class__
     if model not in AUTO_TRANSLATABLE_MODELS:
-        logger.debug(f"Model {model.__name__} not in AUTO_TRANSLATABLE_MODELS")
+        logger.debug("Model %s not in AUTO_TRANSLATABLE_MODELS", model.__name__)
         return
 
-    config = SiteConfiguration.get_solo()
+    config = config or SiteConfiguration.get_solo()
     if not config.auto_translate_enabled:
-        logger.debug(f"Auto translation disabled in config for {model.__name__} pk={instance.pk}")
+        logger.debug("Auto translation disabled in config for %s pk=%s", model.__name__, instance.pk)
         return
 
     source_language = getattr(instance, 'get_current_language', lambda: None)() or config.default_language
     default_language = config.default_language or settings.LANGUAGE_CODE
 
     logger.info(
-        f"Scheduling translation for {model.__name__} pk={instance.pk}, "
-        f"source_lang={source_language}, default_lang={default_language}"
+        "Scheduling translation for %s pk=%s, "
+        "source_lang=%s, default_lang=%s",
+        model.__name__, instance.pk, source_language, default_language,
     )
 
     if source_language != default_language:
         # Only translate when content is saved in default language
         logger.debug(
-            f"Skipping translation for {model.__name__} pk={instance.pk}: "
-            f"source language {source_language} != default {default_language}"
+            "Skipping translation for %s pk=%s: "
+            "source language %s != default %s",
+            model.__name__, instance.pk, source_language, default_language,
         )
         return
 
     pk = instance.pk
-    logger.info(f"Translation scheduled via transaction.on_commit for {model.__name__} pk={pk}")
-    transaction.on_commit(lambda: _run_auto_translation(model, pk, source_language))
+    logger.info("Translation scheduled via transaction.on_commit for %s pk=%s", model.__name__, pk)
+    transaction.on_commit(lambda: _run_auto_translation(model, pk, source_language, config=config))
 
 
-def _run_auto_translation(model: Type, pk: int, source_language: str):
-    logger.info(f"_run_auto_translation called for {model.__name__} pk={pk}, source_lang={source_language}")
+def _run_auto_translation(model: Type, pk: int, source_language: str, config=None):
+    logger.info("_run_auto_translation called for %s pk=%s, source_lang=%s", model.__name__, pk, source_language)
 
     try:
-        instance = model.objects.get(pk=pk)
+        # Prefetching serves both the available languages and the source row below
+        instance = model.objects.prefetch_related('translations').get(pk=pk)
     except model.DoesNotExist:
-        logger.warning(f"Instance {model.__name__} pk={pk} not found for translation")
+        logger.warning("Instance %s pk=%s not found for translation", model.__name__, pk)
         return
 
     # Log current language and available translations
     current_lang = getattr(instance, 'get_current_language', lambda: None)()
     available_langs = getattr(instance, 'get_available_languages', lambda: [])()
     logger.info(
-        f"Instance {model.__name__} pk={pk}: current_lang={current_lang}, "
-        f"available_langs={available_langs}, source_lang={source_language}"
+        "Instance %s pk=%s: current_lang=%s, "
+        "available_langs=%s, source_lang=%s",
+        model.__name__, pk, current_lang, available_langs, source_language,
     )
 
-    config = SiteConfiguration.get_solo()
+    config = config or SiteConfiguration.get_solo()
     if not config.auto_translate_enabled:
-        logger.debug(f"Auto translation disabled, skipping {model.__name__} pk={pk}")
+        logger.debug("Auto translation disabled, skipping %s pk=%s", model.__name__, pk)
         return
 
     try:
@@ -144,28 +176,48 @@ def _run_auto_translation(model: Type, pk: int, source_language: str):
 
     fields = AUTO_TRANSLATABLE_MODELS.get(model, {})
     if not fields:
-        logger.warning(f"No translatable fields configured for {model.__name__}")
+        logger.warning("No translatable fields configured for %s", model.__name__)
         return
 
     # gather source data
     source_data: Dict[str, Tuple[str, str]] = {}
+    try:
+        source_translation = instance.get_translation(source_language)
+    except TranslationDoesNotExist:
+        source_translation = None
     for field, fmt in fields.items():
-        value = instance.safe_translation_getter(field, language_code=source_language, any_language=False)
+        value = getattr(source_translation, field, None)
         if value:
             source_data[field] = (value, fmt)
-            logger.debug(f"  - Field '{field}' has content ({len(value)} chars)")
+            logger.debug("  - Field '%s' has content (%s chars)", field, len(value))
         else:
-            logger.debug(f"  - Field '{field}' is empty")
+            logger.debug("  - Field '%s' is empty", field)
 
     if not source_data:
-        logger.info(f"No source data to translate for {model.__name__} pk={pk} in language {source_language}")
+        logger.info("No source data to translate for %s pk=%s in language %s", model.__name__, pk, source_language)
         return
 
+    # Fingerprint of what is sent to the provider; unchanged sources are not re-translated
+    source_hash = hashlib.sha256(
+        json.dumps([source_language, source_data], sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
     translation_model = instance.translations.model
-    content_type = ContentType.objects.get_for_model(model)
+    content_type = _get_content_type(model)
     target_languages = config.get_target_languages()
 
-    logger.info(f"Will translate {model.__name__} pk={pk} to target languages: {target_languages}")
+    logger.info("Will translate %s pk=%s to target languages: %s", model.__name__, pk, target_languages)
+
+    # Fetch the records of every target language up front; whether a translation
+    # row exists is already known from the available languages read above.
+    records = {
+        record.language_code: record
+        for record in AutoTranslationRecord.objects.filter(
+            content_type=content_type,
+            object_id=pk,
+            language_code__in=target_languages,
+        )
+    }
 
     for target_language in target_languages:
         _translate_language(
@@ -176,6 +228,9 @@ def _run_auto_translation(model: Type, pk: int, source_language: str):
             source_language=source_language,
             target_language=target_language,
             source_data=source_data,
+            source_hash=source_hash,
+            record=records.get(target_language),
+            translation_exists=target_language in available_langs,
         )
 
 
@@ -187,44 +242,51 @@ def _translate_language(
     source_language: str,
     target_language: str,
     source_data: Dict[str, Tuple[str, str]],
+    source_hash: str = '',
+    record=None,
+    translation_exists: bool = False,
 ):
     logger.info(
-        f"_translate_language: {instance.__class__.__name__} pk={instance.pk}, "
-        f"{source_language} -> {target_language}"
+        "_translate_language: %s pk=%s, "
+        "%s -> %s",
+        instance.__class__.__name__, instance.pk, source_language, target_language,
     )
 
     if source_language == target_language:
-        logger.debug(f"Skipping same language: {source_language}")
+        logger.debug("Skipping same language: %s", source_language)
         return
 
-    record = AutoTranslationRecord.objects.filter(
-        content_type=content_type,
-        object_id=instance.pk,
-        language_code=target_language,
-    ).first()
-
-    try:
-        existing_translation = translation_model.objects.get(
-            master_id=instance.pk,
-            language_code=target_language,
-        )
-        logger.debug(f"  - Existing translation found for {target_language}")
-    except translation_model.DoesNotExist:
-        existing_translation = None
-        logger.debug(f"  - No existing translation for {target_language}")
+    if translation_exists:
+        logger.debug("  - Existing translation found for %s", target_language)
+    else:
+        logger.debug("  - No existing translation for %s", target_language)
 
     if record and not record.auto_generated:
         # Respect manual translations explicitly marked
         logger.info(
-            f"Skipping auto translation for {instance.__class__.__name__} pk={instance.pk} "
-            f"lang={target_language} (manual override - record.auto_generated=False)"
+            "Skipping auto translation for %s pk=%s "
+            "lang=%s (manual override - record.auto_generated=False)",
+            instance.__class__.__name__, instance.pk, target_language,
+        )
+        return
+
+    if (
+        translation_exists
+        and record
+        and record.status == AutoTranslationRecord.STATUS_SUCCESS
+        and source_hash
+        and record.source_hash == source_hash
+    ):
+        logger.info(
+            "Skipping auto translation for %s pk=%s lang=%s (source unchanged since last success)",
+            instance.__class__.__name__, instance.pk, target_language,
         )
         return
 
     total_duration = 0
     translated_fields = {}
 
-    logger.info(f"  - Translating {len(source_data)} fields: {list(source_data.keys())}")
+    logger.info("  - Translating %s fields: %s", len(source_data), list(source_data.keys()))
 
     # Import helper libraries for markdown preservation
     # We do this here to avoid failure if dependencies are missing during initial load
@@ -236,88 +298,117 @@ def _translate_language(
         MARKDOWN_SUPPORT = False
         logger.warning("markdown or markdownify not installed. Markdown preservation disabled.")
 
+    # Prepare every field first so the provider is called once per request
+    # format instead of once per field.
+    # Markdown is handled as Markdown -> HTML -> Translate -> Markdown because
+    # LibreTranslate corrupts Markdown in 'text' mode (e.g., '**' becomes '* *')
+    batches: Dict[str, list] = {}
     for field, (value, fmt) in source_data.items():
-        try:
-            logger.debug(f"  - Translating field '{field}' ({len(value)} chars, format={fmt})")
-            
-            # Special handling for Markdown content (TEXT fields usually allow markdown)
-            # LibreTranslate corrupts Markdown in 'text' mode (e.g., '**' becomes '* *')
-            # Solution: Markdown -> HTML -> Translate -> Markdown
-            if fmt == 'text' and MARKDOWN_SUPPORT and len(value) > 0:
-                # Use 'extra' extension to support tables, fenced code blocks, etc.
-                html_content = markdown.markdown(value, extensions=['extra'])
-                translated_result = service.translate(html_content, source_language, target_language, format='html')
-                # Access the text from the result object
-                translated_html_text = translated_result.translated_text
-                
-                # Convert back to Markdown (ATX style favors '#' over underline headers)
-                result_text = CustomMarkdownConverter(heading_style="ATX").convert(translated_html_text)
-                # Clean up potential extra newlines introduced by conversion
-                result_text = result_text.strip()
-                # Create a mock result object to match expected interface if service returns object
-                # But service.translate returns a TranslationResult object
-                # Use result_text as the final string value for the field.
-                final_value = result_text
-            else:
-                # Fallback to standard translation
-                final_value = service.translate(value, source_language, target_language, format='html' if fmt == 'html' else 'text')
-
-            translated_fields[field] = final_value
-            logger.debug(f"  - Field '{field}' translated successfully")
-        except TranslationError as exc:
-            _mark_translation_failure(record, content_type, instance.pk, target_language, source_language, str(exc))
-            logger.exception("Translation error on %s field %s -> %s: %s", instance.__class__.__name__, field, target_language, exc)
-            return
-        except Exception as exc:  # noqa: BLE001
-            _mark_translation_failure(record, content_type, instance.pk, target_language, source_language, str(exc))
-            logger.exception("Unexpected translation failure: %s", exc)
-            return
+        logger.debug("  - Preparing field '%s' (%s chars, format=%s)", field, len(value), fmt)
+        if fmt == 'text' and MARKDOWN_SUPPORT:
+            # Use 'extra' extension to support tables, fenced code blocks, etc.
+            payload = markdown.markdown(value, extensions=['extra'])
+            batches.setdefault('html', []).append((field, payload, True))
+        else:
+            request_format = 'html' if fmt == 'html' else 'text'
+            batches.setdefault(request_format, []).append((field, value, False))
 
+    try:
+        for request_format, items in batches.items():
+            results = service.translate_batch(
+                [payload for _field, payload, _from_markdown in items],
+                source_language,
+                target_language,
+                format=request_format,
+            )
+            total_duration += max((result.duration_ms for result in results), default=0)
+
+            for (field, _payload, from_markdown), result in zip(items, results):
+                final_value = result.translated_text
+                if from_markdown:
+                    # Convert back to Markdown (ATX style favors '#' over underline headers)
+                    # and clean up potential extra newlines introduced by conversion
+                    final_value = CustomMarkdownConverter(heading_style="ATX").convert(final_value).strip()
+                translated_fields[field] = final_value
+                logger.debug("  - Field '%s' translated successfully", field)
+    except TranslationError as exc:
+        _mark_translation_failure(content_type, instance.pk, target_language, source_language, str(exc))
+        logger.exception("Translation error on %s -> %s: %s", instance.__class__.__name__, target_language, exc)
+        return
+    except Exception as exc:  # noqa: BLE001
+        _mark_translation_failure(content_type, instance.pk, target_language, source_language, str(exc))
+        logger.exception("Unexpected translation failure: %s", exc)
+        return
 
     if not translated_fields:
-        logger.warning(f"No fields were translated for {instance.__class__.__name__} pk={instance.pk}, lang={target_language}")
+        logger.warning(
+            "No fields were translated for %s pk=%s, lang=%s",
+            instance.__class__.__name__, instance.pk, target_language,
+        )
         return
 
-    # upsert translation
-    logger.info(f"  - Saving translation to DB for {target_language}")
-    translation_model.objects.update_or_create(
-        master=instance,
-        language_code=target_language,
-        defaults=translated_fields,
-    )
+    # upsert translation and its record in a single transaction
+    logger.info("  - Saving translation to DB for %s", target_language)
+    with transaction.atomic():
+        translation_model.objects.update_or_create(
+            master=instance,
+            language_code=target_language,
+            defaults=translated_fields,
+        )
 
-    record_defaults = {
-        'source_language': source_language,
-    }
-    record, _created = AutoTranslationRecord.objects.update_or_create(
-        content_type=content_type,
-        object_id=instance.pk,
-        language_code=target_language,
-        defaults=record_defaults,
-    )
-    record.provider = service.provider
-    record.duration_ms = total_duration
-    record.auto_generated = True
-    record.status = AutoTranslationRecord.STATUS_SUCCESS
-    record.error_message = ''
-    record.save(update_fields=['provider', 'duration_ms', 'auto_generated', 'status', 'error_message'])
+        # The translation row above keeps going through save() so parler refreshes its
+        # cache and sends post_translation_save.
+        _upsert_record(
+            content_type,
+            instance.pk,
+            target_language,
+            source_language=source_language,
+            provider=service.provider,
+            duration_ms=total_duration,
+            auto_generated=True,
+            status=AutoTranslationRecord.STATUS_SUCCESS,
+            error_message='',
+            source_hash=source_hash,
+        )
 
     logger.info(
-        f"  - Translation SUCCESS: {instance.__class__.__name__} pk={instance.pk}, "
-        f"lang={target_language}, duration={total_duration}ms, record_created={_created}"
+        "  - Translation SUCCESS: %s pk=%s, "
+        "lang=%s, duration=%sms, record_existed=%s",
+        instance.__class__.__name__, instance.pk, target_language, total_duration, record is not None,
+    )
+
+
+def _upsert_record(content_type, object_id, target_language, **values):
+    """
+    Write the AutoTranslationRecord of one target language with a single
+    INSERT ... ON CONFLICT DO UPDATE, whether or not the row already exists.
+    """
+    AutoTranslationRecord.objects.bulk_create(
+        [
+            AutoTranslationRecord(
+                content_type=content_type,
+                object_id=object_id,
+                language_code=target_language,
+                **values,
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=['content_type', 'object_id', 'language_code'],
+        update_fields=RECORD_UPSERT_FIELDS,
     )
 
 
-def _mark_translation_failure(record, content_type, object_id, target_language, source_language, message: str):
-    record = record or AutoTranslationRecord(
-        content_type=content_type,
-        object_id=object_id,
-        language_code=target_language,
+def _mark_translation_failure(content_type, object_id, target_language, source_language, message: str):
+    _upsert_record(
+        content_type,
+        object_id,
+        target_language,
         source_language=source_language,
+        provider='',
+        duration_ms=0,
+        # Still an automatic record: only manual overrides may block the retry
+        auto_generated=True,
+        status=AutoTranslationRecord.STATUS_FAILED,
+        error_message=message[:1000],
+        source_hash='',
     )
-    record.auto_generated = False
-    record.provider = ''
-    record.duration_ms = 0
-    record.status = AutoTranslationRecord.STATUS_FAILED
-    record.error_message = message[:1000]
-    record.save()
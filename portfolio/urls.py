@@ -2,7 +2,7 @@
 URL configuration for portfolio app.
 Single page portfolio with clean layout
 """
-from django.urls import path
+from django.urls import include, path
 from . import views
 
 app_name = 'portfolio'
@@ -41,80 +41,98 @@ urlpatterns = [
     path('dashboard/settings/', views.SiteConfigurationUpdateView.as_view(), name='admin-site-configuration'),
     path('analytics/', views.AnalyticsView.as_view(), name='admin-analytics'),
     
-    # Profile Management
-    path('manage/profile/edit/', views.ProfileUpdateView.as_view(), name='admin-profile-edit'),
-    
-    # Project Management
-    path('manage/projects/', views.ProjectListAdminView.as_view(), name='admin-project-list'),
-    path('manage/projects/create/', views.ProjectCreateView.as_view(), name='admin-project-create'),
-    path('manage/projects/<int:pk>/edit/', views.ProjectUpdateView.as_view(), name='admin-project-edit'),
-    path('manage/projects/<int:pk>/delete/', views.ProjectDeleteView.as_view(), name='admin-project-delete'),
-
-    # Catalog Management - Categories
-    path('manage/catalogs/categories/', views.CategoryListAdminView.as_view(), name='admin-category-list'),
-    path('manage/catalogs/categories/create/', views.CategoryCreateView.as_view(), name='admin-category-create'),
-    path('manage/catalogs/categories/<int:pk>/edit/', views.CategoryUpdateView.as_view(), name='admin-category-edit'),
-    path('manage/catalogs/categories/<int:pk>/delete/', views.CategoryDeleteView.as_view(), name='admin-category-delete'),
-
-    # Catalog Management - Project Types
-    path('manage/catalogs/project-types/', views.ProjectTypeListAdminView.as_view(), name='admin-projecttype-list'),
-    path('manage/catalogs/project-types/create/', views.ProjectTypeCreateView.as_view(), name='admin-projecttype-create'),
-    path('manage/catalogs/project-types/<int:pk>/edit/', views.ProjectTypeUpdateView.as_view(), name='admin-projecttype-edit'),
-    path('manage/catalogs/project-types/<int:pk>/delete/', views.ProjectTypeDeleteView.as_view(), name='admin-projecttype-delete'),
-
-    # Catalog Management - Knowledge Bases
-    path('manage/catalogs/knowledge-bases/', views.KnowledgeBaseListAdminView.as_view(), name='admin-knowledgebase-list'),
-    path('manage/catalogs/knowledge-bases/create/', views.KnowledgeBaseCreateView.as_view(), name='admin-knowledgebase-create'),
-    path('manage/catalogs/knowledge-bases/<int:pk>/edit/', views.KnowledgeBaseUpdateView.as_view(), name='admin-knowledgebase-edit'),
-    path('manage/catalogs/knowledge-bases/<int:pk>/delete/', views.KnowledgeBaseDeleteView.as_view(), name='admin-knowledgebase-delete'),
-
-    # Blog Post Management
-    path('manage/blog/', views.BlogPostListAdminView.as_view(), name='admin-blog-list'),
-    path('manage/blog/create/', views.BlogPostCreateView.as_view(), name='admin-blog-create'),
-    path('manage/blog/<int:pk>/edit/', views.BlogPostUpdateView.as_view(), name='admin-blog-edit'),
-    path('manage/blog/<int:pk>/delete/', views.BlogPostDeleteView.as_view(), name='admin-blog-delete'),
-    
-    # Contact Management
-    path('manage/contacts/', views.ContactListAdminView.as_view(), name='admin-contact-list'),
-    path('manage/contacts/<int:pk>/', views.ContactDetailView.as_view(), name='admin-contact-detail'),
-    path('manage/contacts/<int:pk>/delete/', views.ContactDeleteView.as_view(), name='admin-contact-delete'),
-    
-    # CV Management Hub
-    path('manage/cv/', views.CVManagementView.as_view(), name='admin-cv-hub'),
-    
-    # CV Management - Experience
-    path('manage/cv/experience/', views.ExperienceListAdminView.as_view(), name='admin-experience-list'),
-    path('manage/cv/experience/create/', views.ExperienceCreateView.as_view(), name='admin-experience-create'),
-    path('manage/cv/experience/<int:pk>/edit/', views.ExperienceUpdateView.as_view(), name='admin-experience-edit'),
-    path('manage/cv/experience/<int:pk>/delete/', views.ExperienceDeleteView.as_view(), name='admin-experience-delete'),
-    
-    # CV Management - Education
-    path('manage/cv/education/', views.EducationListAdminView.as_view(), name='admin-education-list'),
-    path('manage/cv/education/create/', views.EducationCreateView.as_view(), name='admin-education-create'),
-    path('manage/cv/education/<int:pk>/edit/', views.EducationUpdateView.as_view(), name='admin-education-edit'),
-    path('manage/cv/education/<int:pk>/delete/', views.EducationDeleteView.as_view(), name='admin-education-delete'),
-    
-    # CV Management - Skills
-    path('manage/cv/skills/', views.SkillListAdminView.as_view(), name='admin-skill-list'),
-    path('manage/cv/skills/create/', views.SkillCreateView.as_view(), name='admin-skill-create'),
-    path('manage/cv/skills/<int:pk>/edit/', views.SkillUpdateView.as_view(), name='admin-skill-edit'),
-    path('manage/cv/skills/<int:pk>/delete/', views.SkillDeleteView.as_view(), name='admin-skill-delete'),
-    
-    # AJAX Quick Actions
-    path('manage/ajax/upload-blog-image/', views.BlogImageUploadView.as_view(), name='ajax-upload-blog-image'),
-    path('manage/ajax/toggle-contact-read/', views.ToggleContactReadView.as_view(), name='ajax-toggle-contact-read'),
-    path('manage/ajax/toggle-project-featured/', views.ToggleProjectFeaturedView.as_view(), name='ajax-toggle-project-featured'),
-    path('manage/ajax/toggle-blog-featured/', views.ToggleBlogPostFeaturedView.as_view(), name='ajax-toggle-blog-featured'),
-    path('manage/ajax/quick-publish-blog/', views.QuickPublishBlogPostView.as_view(), name='ajax-quick-publish-blog'),
-    path('manage/ajax/test-email/', views.EmailTestView.as_view(), name='ajax-test-email'),
-    
+    # Content management (protected). Grouped under include() prefixes so public
+    # URLs skip the whole subtree after one failed prefix match.
+    path('manage/', include([
+        # Profile Management
+        path('profile/edit/', views.ProfileUpdateView.as_view(), name='admin-profile-edit'),
+
+        # Project Management
+        path('projects/', include([
+            path('', views.ProjectListAdminView.as_view(), name='admin-project-list'),
+            path('create/', views.ProjectCreateView.as_view(), name='admin-project-create'),
+            path('<int:pk>/edit/', views.ProjectUpdateView.as_view(), name='admin-project-edit'),
+            path('<int:pk>/delete/', views.ProjectDeleteView.as_view(), name='admin-project-delete'),
+        ])),
+
+        path('catalogs/', include([
+            # Catalog Management - Categories
+            path('categories/', views.CategoryListAdminView.as_view(), name='admin-category-list'),
+            path('categories/create/', views.CategoryCreateView.as_view(), name='admin-category-create'),
+            path('categories/<int:pk>/edit/', views.CategoryUpdateView.as_view(), name='admin-category-edit'),
+            path('categories/<int:pk>/delete/', views.CategoryDeleteView.as_view(), name='admin-category-delete'),
+
+            # Catalog Management - Project Types
+            path('project-types/', views.ProjectTypeListAdminView.as_view(), name='admin-projecttype-list'),
+            path('project-types/create/', views.ProjectTypeCreateView.as_view(), name='admin-projecttype-create'),
+            path('project-types/<int:pk>/edit/', views.ProjectTypeUpdateView.as_view(), name='admin-projecttype-edit'),
+            path('project-types/<int:pk>/delete/', views.ProjectTypeDeleteView.as_view(), name='admin-projecttype-delete'),
+
+            # Catalog Management - Knowledge Bases
+            path('knowledge-bases/', views.KnowledgeBaseListAdminView.as_view(), name='admin-knowledgebase-list'),
+            path('knowledge-bases/create/', views.KnowledgeBaseCreateView.as_view(), name='admin-knowledgebase-create'),
+            path('knowledge-bases/<int:pk>/edit/', views.KnowledgeBaseUpdateView.as_view(), name='admin-knowledgebase-edit'),
+            path('knowledge-bases/<int:pk>/delete/', views.KnowledgeBaseDeleteView.as_view(), name='admin-knowledgebase-delete'),
+        ])),
+
+        # Blog Post Management
+        path('blog/', include([
+            path('', views.BlogPostListAdminView.as_view(), name='admin-blog-list'),
+            path('create/', views.BlogPostCreateView.as_view(), name='admin-blog-create'),
+            path('<int:pk>/edit/', views.BlogPostUpdateView.as_view(), name='admin-blog-edit'),
+            path('<int:pk>/delete/', views.BlogPostDeleteView.as_view(), name='admin-blog-delete'),
+        ])),
+
+        # Contact Management
+        path('contacts/', include([
+            path('', views.ContactListAdminView.as_view(), name='admin-contact-list'),
+            path('<int:pk>/', views.ContactDetailView.as_view(), name='admin-contact-detail'),
+            path('<int:pk>/delete/', views.ContactDeleteView.as_view(), name='admin-contact-delete'),
+        ])),
+
+        path('cv/', include([
+            # CV Management Hub
+            path('', views.CVManagementView.as_view(), name='admin-cv-hub'),
+
+            # CV Management - Experience
+            path('experience/', views.ExperienceListAdminView.as_view(), name='admin-experience-list'),
+            path('experience/create/', views.ExperienceCreateView.as_view(), name='admin-experience-create'),
+            path('experience/<int:pk>/edit/', views.ExperienceUpdateView.as_view(), name='admin-experience-edit'),
+            path('experience/<int:pk>/delete/', views.ExperienceDeleteView.as_view(), name='admin-experience-delete'),
+
+            # CV Management - Education
+            path('education/', views.EducationListAdminView.as_view(), name='admin-education-list'),
+            path('education/create/', views.EducationCreateView.as_view(), name='admin-education-create'),
+            path('education/<int:pk>/edit/', views.EducationUpdateView.as_view(), name='admin-education-edit'),
+            path('education/<int:pk>/delete/', views.EducationDeleteView.as_view(), name='admin-education-delete'),
+
+            # CV Management - Skills
+            path('skills/', views.SkillListAdminView.as_view(), name='admin-skill-list'),
+            path('skills/create/', views.SkillCreateView.as_view(), name='admin-skill-create'),
+            path('skills/<int:pk>/edit/', views.SkillUpdateView.as_view(), name='admin-skill-edit'),
+            path('skills/<int:pk>/delete/', views.SkillDeleteView.as_view(), name='admin-skill-delete'),
+        ])),
+
+        # AJAX Quick Actions
+        path('ajax/', include([
+            path('upload-blog-image/', views.BlogImageUploadView.as_view(), name='ajax-upload-blog-image'),
+            path('toggle-contact-read/', views.ToggleContactReadView.as_view(), name='ajax-toggle-contact-read'),
+            path('toggle-project-featured/', views.ToggleProjectFeaturedView.as_view(), name='ajax-toggle-project-featured'),
+            path('toggle-blog-featured/', views.ToggleBlogPostFeaturedView.as_view(), name='ajax-toggle-blog-featured'),
+            path('quick-publish-blog/', views.QuickPublishBlogPostView.as_view(), name='ajax-quick-publish-blog'),
+            path('test-email/', views.EmailTestView.as_view(), name='ajax-test-email'),
+        ])),
+    ])),
+
     # Language Management API
-    path('admin-panel/languages/list/', views.LanguageListAPIView.as_view(), name='api-language-list'),
-    path('admin-panel/languages/<int:pk>/', views.LanguageDetailAPIView.as_view(), name='api-language-detail'),
-    path('admin-panel/languages/create/', views.LanguageCreateAPIView.as_view(), name='api-language-create'),
-    path('admin-panel/languages/<int:pk>/update/', views.LanguageUpdateAPIView.as_view(), name='api-language-update'),
-    path('admin-panel/languages/<int:pk>/delete/', views.LanguageDeleteAPIView.as_view(), name='api-language-delete'),
-    
+    path('admin-panel/languages/', include([
+        path('list/', views.LanguageListAPIView.as_view(), name='api-language-list'),
+        path('<int:pk>/', views.LanguageDetailAPIView.as_view(), name='api-language-detail'),
+        path('create/', views.LanguageCreateAPIView.as_view(), name='api-language-create'),
+        path('<int:pk>/update/', views.LanguageUpdateAPIView.as_view(), name='api-language-update'),
+        path('<int:pk>/delete/', views.LanguageDeleteAPIView.as_view(), name='api-language-delete'),
+    ])),
+
     # SEO URLs
     path('robots.txt', views.robots_txt, name='robots-txt'),
     path('.well-known/security.txt', views.security_txt, name='security-txt'),
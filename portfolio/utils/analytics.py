@@ -1,9 +1,14 @@
+from django.db import transaction
+from django.db.models import Count, Q
 from django.utils import timezone
 from datetime import timedelta
 import logging
 
 logger = logging.getLogger('portfolio')
 
+# Rows removed per DELETE so a large backlog never holds one long transaction.
+CLEANUP_BATCH_SIZE = 10000
+
 def cleanup_old_page_visits(days_to_keep=180):
     """
     Clean up old page visit data to optimize database performance
@@ -22,17 +27,24 @@ def cleanup_old_page_visits(days_to_keep=180):
     try:
         cutoff_date = timezone.now() - timedelta(days=days_to_keep)
 
-        # Count records to be deleted
         old_visits = PageVisit.objects.filter(timestamp__lt=cutoff_date)
-        count_to_delete = old_visits.count()
+        deleted_count = 0
+
+        # delete() already reports how many rows went away, so no upfront count().
+        while True:
+            with transaction.atomic():
+                batch = list(old_visits.values_list('pk', flat=True)[:CLEANUP_BATCH_SIZE])
+                if not batch:
+                    break
+                deleted, _ = PageVisit.objects.filter(pk__in=batch).delete()
+            deleted_count += deleted
+            if len(batch) < CLEANUP_BATCH_SIZE:
+                break
 
-        if count_to_delete == 0:
+        if deleted_count == 0:
             logger.info(f'No page visit records older than {days_to_keep} days found for cleanup')
             return 0
 
-        # Delete old records
-        deleted_count, _ = old_visits.delete()
-
         logger.info(f'Automatically cleaned up {deleted_count} page visit records older than {cutoff_date.date()}')
 
         return deleted_count
@@ -52,19 +64,41 @@ def get_analytics_summary():
     from ..models import PageVisit, BlogPost, Contact, Project
     
     now = timezone.now()
-    today = now.date()
+    # Half-open range instead of timestamp__date so the column isn't wrapped in a
+    # timezone conversion and an index on timestamp stays usable
+    start_of_day = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
     week_ago = now - timedelta(days=7)
     month_ago = now - timedelta(days=30)
 
+    # One conditional aggregate per model instead of a COUNT(*) per figure.
+    visits = PageVisit.objects.aggregate(
+        total=Count('id'),
+        today=Count('id', filter=Q(timestamp__gte=start_of_day, timestamp__lt=start_of_day + timedelta(days=1))),
+        week=Count('id', filter=Q(timestamp__gte=week_ago)),
+        month=Count('id', filter=Q(timestamp__gte=month_ago)),
+    )
+    posts = BlogPost.objects.aggregate(
+        total=Count('id'),
+        published=Count('id', filter=Q(status='published')),
+    )
+    projects = Project.objects.aggregate(
+        total=Count('id'),
+        public=Count('id', filter=Q(visibility='public')),
+    )
+    messages = Contact.objects.aggregate(
+        total=Count('id'),
+        unread=Count('id', filter=Q(read=False)),
+    )
+
     return {
-        'total_visits': PageVisit.objects.count(),
-        'today_visits': PageVisit.objects.filter(timestamp__date=today).count(),
-        'week_visits': PageVisit.objects.filter(timestamp__gte=week_ago).count(),
-        'month_visits': PageVisit.objects.filter(timestamp__gte=month_ago).count(),
-        'total_posts': BlogPost.objects.count(),
-        'published_posts': BlogPost.objects.filter(status='published').count(),
-        'total_projects': Project.objects.count(),
-        'public_projects': Project.objects.filter(visibility='public').count(),
-        'total_messages': Contact.objects.count(),
-        'unread_messages': Contact.objects.filter(read=False).count(),
+        'total_visits': visits['total'],
+        'today_visits': visits['today'],
+        'week_visits': visits['week'],
+        'month_visits': visits['month'],
+        'total_posts': posts['total'],
+        'published_posts': posts['published'],
+        'total_projects': projects['total'],
+        'public_projects': projects['public'],
+        'total_messages': messages['total'],
+        'unread_messages': messages['unread'],
     }
@@ -10,6 +10,14 @@ from django.utils.html import strip_tags
 
 logger = logging.getLogger('portfolio')
 
+# Domain groups used by EmailDomainChecker
+HIGH_COMPAT_DOMAINS = frozenset({'gmail.com', 'googlemail.com', 'google.com'})
+MEDIUM_COMPAT_DOMAINS = frozenset({
+    'outlook.com', 'hotmail.com', 'live.com', 'msn.com',
+    'yahoo.com', 'ymail.com', 'aol.com', 'icloud.com',
+})
+PROBLEMATIC_DOMAINS = frozenset({'example.com', 'test.com', 'localhost'})
+
 
 class EmailService:
     """Service class for handling email operations."""
@@ -122,8 +130,8 @@ class EmailService:
             logger.error(f'Failed to send contact confirmation email to {contact.email}: {e}')
             
             # Log additional info for external domains
-            domain = contact.email.split('@')[1] if '@' in contact.email else 'unknown'
-            if domain.lower() not in ['gmail.com', 'googlemail.com']:
+            if EmailDomainChecker.check_domain_compatibility(contact.email).get('level') != 'high':
+                domain = contact.email.split('@', 1)[1] if '@' in contact.email else 'unknown'
                 logger.warning(f'Email sent to external domain ({domain}). Delivery may be delayed or blocked by recipient server.')
             
             return False
@@ -213,33 +221,23 @@ class EmailDomainChecker:
         if not email or '@' not in email:
             return {'compatible': False, 'reason': 'Invalid email format'}
         
-        domain = email.split('@')[1].lower()
-        
-        # High compatibility domains
-        high_compat = ['gmail.com', 'googlemail.com', 'google.com']
-        
-        # Medium compatibility domains  
-        medium_compat = ['outlook.com', 'hotmail.com', 'live.com', 'msn.com', 
-                        'yahoo.com', 'ymail.com', 'aol.com', 'icloud.com']
-        
-        # Known problematic patterns
-        problematic = ['example.com', 'test.com', 'localhost']
+        domain = email.split('@', 1)[1].lower()
         
-        if domain in high_compat:
+        if domain in HIGH_COMPAT_DOMAINS:
             return {
                 'compatible': True,
                 'level': 'high',
                 'delivery_time': '< 1 minute',
                 'recommendation': 'Emails should deliver immediately'
             }
-        elif domain in medium_compat:
+        elif domain in MEDIUM_COMPAT_DOMAINS:
             return {
                 'compatible': True,
                 'level': 'medium', 
                 'delivery_time': '1-10 minutes',
                 'recommendation': 'Emails may take a few minutes to deliver'
             }
-        elif domain in problematic:
+        elif domain in PROBLEMATIC_DOMAINS:
             return {
                 'compatible': False,
                 'level': 'none',
@@ -2,12 +2,34 @@
 Custom file upload handlers with enhanced security.
 """
 import os
+import re
 import uuid
 from django.core.files.storage import default_storage
 from django.core.files.uploadhandler import TemporaryFileUploadHandler
 from django.conf import settings
 from .validators import validate_filename, validate_no_executable
 
+# Content patterns that reject an upload chunk, matched case-insensitively
+SUSPICIOUS_CONTENT_PATTERNS = (
+    b'<?php',
+    b'<script',
+    b'javascript:',
+    b'vbscript:',
+    b'onload=',
+    b'onerror=',
+    b'eval(',
+    b'exec(',
+    b'system(',
+    b'shell_exec(',
+    b'passthru(',
+    b'base64_decode(',
+)
+# One pass over the raw bytes instead of decode + lower + a scan per pattern
+SUSPICIOUS_CONTENT_RE = re.compile(
+    b'|'.join(re.escape(pattern) for pattern in SUSPICIOUS_CONTENT_PATTERNS),
+    re.IGNORECASE,
+)
+
 
 def secure_filename(filename):
     """
@@ -77,33 +99,9 @@ class SecureFileUploadHandler(TemporaryFileUploadHandler):
         """
         Check for suspicious patterns in file content.
         """
-        # Convert bytes to string for pattern matching
-        try:
-            content = data.decode('utf-8', errors='ignore').lower()
-        except:
-            content = str(data).lower()
-        
-        # Suspicious patterns
-        suspicious_patterns = [
-            '<?php',
-            '<script',
-            'javascript:',
-            'vbscript:',
-            'onload=',
-            'onerror=',
-            'eval(',
-            'exec(',
-            'system(',
-            'shell_exec(',
-            'passthru(',
-            'base64_decode(',
-        ]
-        
-        for pattern in suspicious_patterns:
-            if pattern in content:
-                return True
-        
-        return False
+        if isinstance(data, str):
+            data = data.encode('utf-8', errors='ignore')
+        return SUSPICIOUS_CONTENT_RE.search(data) is not None
 
 
 from django.core.exceptions import ValidationError
@@ -112,6 +110,7 @@ from io import BytesIO
 import sys
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from PIL import Image, ImageOps
+from .images import shrink_on_load
 
 def compress_image(uploaded_file, max_width=1920, quality=85):
     """
@@ -123,6 +122,9 @@ def compress_image(uploaded_file, max_width=1920, quality=85):
         if hasattr(uploaded_file, 'seek'):
             uploaded_file.seek(0)
         img = Image.open(uploaded_file)
+
+        # Decode large JPEGs at reduced scale instead of at full resolution
+        shrink_on_load(img, max_width)
         
         # Handle EXIF orientation (fixes rotation issues)
         img = ImageOps.exif_transpose(img)
@@ -206,24 +208,33 @@ def clean_uploaded_file(uploaded_file):
     return uploaded_file
 
 
+# Compiled once for sanitize_svg. Each pattern is applied in this order, as a
+# separate pass: removing one match can expose another for a later pattern.
+SVG_SCRIPT_PATTERNS = (
+    re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'javascript:', re.IGNORECASE),
+    re.compile(r'vbscript:', re.IGNORECASE),
+    # Event handler attributes, value included, so no stray quoted value is left behind
+    re.compile(r'\s*\bon\w+\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]*)', re.IGNORECASE),
+)
+SVG_DANGEROUS_ELEMENT_PATTERNS = tuple(
+    re.compile(f'<{element}[^>]*>.*?</{element}>', re.IGNORECASE | re.DOTALL)
+    for element in ('script', 'object', 'embed', 'iframe', 'frame', 'frameset')
+)
+
+
 def sanitize_svg(svg_content):
     """
     Sanitize SVG content to remove potentially dangerous elements.
     Note: This is a basic implementation. For production, consider using
     a dedicated library like bleach or defusedxml.
     """
-    import re
-    
     # Remove script tags and javascript
-    svg_content = re.sub(r'<script[^>]*>.*?</script>', '', svg_content, flags=re.IGNORECASE | re.DOTALL)
-    svg_content = re.sub(r'javascript:', '', svg_content, flags=re.IGNORECASE)
-    svg_content = re.sub(r'vbscript:', '', svg_content, flags=re.IGNORECASE)
-    svg_content = re.sub(r'on\w+\s*=', '', svg_content, flags=re.IGNORECASE)
+    for pattern in SVG_SCRIPT_PATTERNS:
+        svg_content = pattern.sub('', svg_content)
     
     # Remove potentially dangerous elements
-    dangerous_elements = ['script', 'object', 'embed', 'iframe', 'frame', 'frameset']
-    for element in dangerous_elements:
-        pattern = f'<{element}[^>]*>.*?</{element}>'
-        svg_content = re.sub(pattern, '', svg_content, flags=re.IGNORECASE | re.DOTALL)
+    for pattern in SVG_DANGEROUS_ELEMENT_PATTERNS:
+        svg_content = pattern.sub('', svg_content)
     
     return svg_content
\ No newline at end of file
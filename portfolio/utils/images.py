@@ -12,6 +12,20 @@ import logging
 
 logger = logging.getLogger('portfolio')
 
+
+def shrink_on_load(img, max_size):
+    """
+    Ask libjpeg to decode a large JPEG at 1/2, 1/4 or 1/8 scale.
+
+    Must run before the image is loaded (any convert/transpose/crop). The decoded
+    image still covers ``max_size`` on both sides whatever its EXIF orientation,
+    so the final LANCZOS resize keeps working from at least the target size.
+    """
+    if img.format == 'JPEG' and max(img.size) > max_size:
+        img.draft(None, (max_size, max_size))
+    return img
+
+
 class ImageOptimizer:
     """
     Utility class for optimizing images uploaded to the portfolio.
@@ -52,6 +66,11 @@ class ImageOptimizer:
         """
         try:
             with Image.open(image_file) as img:
+                original_width, original_height = img.size
+                if quality != 'high':
+                    # Keep 2x oversampling for the final resize
+                    shrink_on_load(img, target_size * 2)
+
                 # Convert to RGB if necessary
                 if img.mode in ('RGBA', 'LA', 'P'):
                     background = Image.new('RGB', img.size, (255, 255, 255))
@@ -65,15 +84,15 @@ class ImageOptimizer:
                 # Auto-orient image based on EXIF data
                 img = ImageOps.exif_transpose(img)
                 
-                # Get original dimensions
-                original_width, original_height = img.size
+                # Get dimensions (smaller than the original if decoded at reduced scale)
+                width, height = img.size
                 
                 # Make image square by cropping to center
-                min_dimension = min(original_width, original_height)
+                min_dimension = min(width, height)
                 
                 # Calculate crop box to center the square
-                left = (original_width - min_dimension) // 2
-                top = (original_height - min_dimension) // 2
+                left = (width - min_dimension) // 2
+                top = (height - min_dimension) // 2
                 right = left + min_dimension
                 bottom = top + min_dimension
                 
@@ -133,6 +152,19 @@ class ImageOptimizer:
         try:
             # Open the image
             with Image.open(image_file) as img:
+                # Get dimensions
+                original_width, original_height = img.size
+
+                # Determine target dimensions
+                if max_width and max_height:
+                    target_width, target_height = max_width, max_height
+                else:
+                    target_width, target_height = cls.MAX_DIMENSIONS.get(
+                        image_type, cls.MAX_DIMENSIONS['project']
+                    )
+
+                shrink_on_load(img, max(target_width, target_height))
+
                 # Convert to RGB if necessary (for JPEG compatibility)
                 if img.mode in ('RGBA', 'LA', 'P'):
                     # Create white background for transparent images
@@ -147,19 +179,8 @@ class ImageOptimizer:
                 # Auto-orient image based on EXIF data
                 img = ImageOps.exif_transpose(img)
                 
-                # Get dimensions
-                original_width, original_height = img.size
-                
-                # Determine target dimensions
-                if max_width and max_height:
-                    target_width, target_height = max_width, max_height
-                else:
-                    target_width, target_height = cls.MAX_DIMENSIONS.get(
-                        image_type, cls.MAX_DIMENSIONS['project']
-                    )
-                
                 # Calculate new dimensions maintaining aspect ratio
-                if original_width > target_width or original_height > target_height:
+                if img.width > target_width or img.height > target_height:
                     img.thumbnail((target_width, target_height), Image.Resampling.LANCZOS)
                     logger.info(f'Resized image from {original_width}x{original_height} to {img.size}')
                 
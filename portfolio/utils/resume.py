@@ -1,42 +1,56 @@
-def get_education_summary(profile):
+from django.db.models import Count, Q
+
+
+def get_education_summary():
     """
     Get a summary of education organized by type for quick display
 
-    Args:
-        profile: Profile model instance
-
     Returns:
         dict: Education summary with counts and latest entries
     """
-    education_qs = profile.education_set.all()
+    from ..models import Education
 
-    return {
-        'formal_count': education_qs.filter(education_type='formal').count(),
-        'certification_count': education_qs.filter(education_type='certification').count(),
-        'course_count': education_qs.filter(education_type='online_course').count(),
-        'bootcamp_count': education_qs.filter(education_type__in=['bootcamp', 'workshop']).count(),
-        'latest_formal': education_qs.filter(education_type='formal').first(),
-        'latest_certification': education_qs.filter(education_type='certification').first(),
-        'total_count': education_qs.count(),
-    }
+    education_qs = Education.objects.all()
+
+    summary = education_qs.aggregate(
+        formal_count=Count('id', filter=Q(education_type='formal')),
+        certification_count=Count('id', filter=Q(education_type='certification')),
+        course_count=Count('id', filter=Q(education_type='online_course')),
+        bootcamp_count=Count('id', filter=Q(education_type__in=['bootcamp', 'workshop'])),
+        total_count=Count('id'),
+    )
 
+    # Both "latest" entries come from one ordered fetch; the default ordering
+    # puts the most recent entry of each type first.
+    latest = {}
+    for entry in education_qs.filter(education_type__in=['formal', 'certification']):
+        latest.setdefault(entry.education_type, entry)
+    summary['latest_formal'] = latest.get('formal')
+    summary['latest_certification'] = latest.get('certification')
 
-def get_skills_summary(profile):
+    return summary
+
+
+def get_skills_summary():
     """
     Get a summary of skills organized by proficiency and category
 
-    Args:
-        profile: Profile model instance
-
     Returns:
         dict: Skills summary with counts and top skills
     """
-    skills_qs = profile.skill_set.all()
+    from ..models import Skill
+
+    skills_qs = Skill.objects.all()
+
+    counts = skills_qs.aggregate(
+        total_count=Count('id'),
+        expert_count=Count('id', filter=Q(proficiency=4)),
+        advanced_count=Count('id', filter=Q(proficiency=3)),
+    )
 
     return {
-        'total_count': skills_qs.count(),
-        'expert_count': skills_qs.filter(proficiency=4).count(),
-        'advanced_count': skills_qs.filter(proficiency=3).count(),
-        'categories': skills_qs.values_list('category', flat=True).distinct(),
+        **counts,
+        # Explicit ordering keeps Meta.ordering's extra columns out of the DISTINCT
+        'categories': skills_qs.order_by('category').values_list('category', flat=True).distinct(),
         'top_skills': skills_qs.filter(proficiency__gte=3).order_by('-proficiency', '-years_experience')[:8],
     }
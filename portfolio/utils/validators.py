@@ -155,17 +155,25 @@ class DocumentValidator(FileValidator):
         )
 
 
+DANGEROUS_EXTENSIONS = frozenset({
+    '.exe', '.bat', '.cmd', '.com', '.pif', '.scr', '.vbs', '.js', '.jar',
+    '.sh', '.py', '.php', '.asp', '.aspx', '.jsp', '.pl', '.cgi'
+})
+
+RESERVED_FILENAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5',
+    'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4',
+    'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+
 def validate_no_executable(file):
     """
     Validator to prevent executable file uploads.
     """
-    dangerous_extensions = [
-        '.exe', '.bat', '.cmd', '.com', '.pif', '.scr', '.vbs', '.js', '.jar',
-        '.sh', '.py', '.php', '.asp', '.aspx', '.jsp', '.pl', '.cgi'
-    ]
-    
+    # The extension is taken from the full name, so "photo.jpg\x00.exe" still ends in .exe
     ext = os.path.splitext(file.name)[1].lower()
-    if ext in dangerous_extensions:
+    if ext in DANGEROUS_EXTENSIONS:
         raise ValidationError('No se permiten archivos ejecutables por seguridad')
 
 
@@ -193,14 +201,8 @@ def validate_filename(filename):
         raise ValidationError('Nombre de archivo no válido')
 
     # Check for reserved names (Windows)
-    reserved_names = [
-        'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5',
-        'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4',
-        'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    ]
-
     name_without_ext = os.path.splitext(filename)[0].upper()
-    if name_without_ext in reserved_names:
+    if name_without_ext in RESERVED_FILENAMES:
         raise ValidationError('Nombre de archivo reservado del sistema')
 
 
@@ -1,9 +1,10 @@
 import json
 from collections import Counter
+from datetime import date
+from operator import attrgetter
 from django.conf import settings
 from django.contrib import messages
 from django.db.models import Q, Count
-from django.db.models.functions import Coalesce
 from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
@@ -38,18 +39,36 @@ class ResumeView(TemplateView):
 
         context['last_updated'] = timezone.now()
 
-        context['experiences'] = Experience.objects.language(current_language).all().order_by('-start_date')
+        context['experiences'] = (
+            Experience.objects.language(current_language)
+            .prefetch_related('translations')
+            .order_by('-start_date')
+        )
 
-        education_qs = Education.objects.language(current_language).all()
-        
-        context['formal_education'] = education_qs.filter(education_type='formal').order_by('-start_date')
-        context['certifications'] = education_qs.filter(education_type='certification').annotate(
-            sort_date=Coalesce('end_date', 'start_date')
-        ).order_by('-sort_date')
-        context['online_courses'] = education_qs.filter(education_type='online_course').annotate(
-            sort_date=Coalesce('end_date', 'start_date')
-        ).order_by('-sort_date')
-        context['bootcamps'] = education_qs.filter(education_type__in=['bootcamp', 'workshop']).order_by('-end_date')
+        # One query (plus the prefetched translations) for every education entry,
+        # split by type in Python instead of one filtered query per section
+        education_by_type = {}
+        for education in Education.objects.language(current_language).prefetch_related('translations'):
+            education_by_type.setdefault(education.education_type, []).append(education)
+
+        def most_recent(education):
+            return education.end_date or education.start_date
+
+        context['formal_education'] = sorted(
+            education_by_type.get('formal', []), key=attrgetter('start_date'), reverse=True
+        )
+        context['certifications'] = sorted(
+            education_by_type.get('certification', []), key=most_recent, reverse=True
+        )
+        context['online_courses'] = sorted(
+            education_by_type.get('online_course', []), key=most_recent, reverse=True
+        )
+        # Ongoing entries (no end date) first, matching PostgreSQL's DESC ordering of NULLs
+        context['bootcamps'] = sorted(
+            education_by_type.get('bootcamp', []) + education_by_type.get('workshop', []),
+            key=lambda education: (education.end_date is None, education.end_date or date.min),
+            reverse=True,
+        )
 
         # Calculate Top Institutions for Continuous Learning
         courses_qs = context['online_courses']
@@ -57,7 +76,11 @@ class ResumeView(TemplateView):
         top_institutions = Counter(institutions).most_common(5)
         context['top_institutions'] = [{'name': name, 'count': count} for name, count in top_institutions]
 
-        skills = Skill.objects.language(current_language).all().order_by('category', '-proficiency')
+        skills = (
+            Skill.objects.language(current_language)
+            .prefetch_related('translations')
+            .order_by('category', '-proficiency')
+        )
         skills_by_category = {}
         for skill in skills:
             skills_by_category.setdefault(skill.category, []).append(skill)